@@ -19,9 +19,6 @@ Or use demo mode:
 """
 
 import sys
-from pathlib import Path
-
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from tripwire import TripWire
 
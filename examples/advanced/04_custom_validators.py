@@ -20,13 +20,14 @@ Or use demo mode:
 
 import re
 import sys
-from pathlib import Path
-
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from tripwire import TripWire
 from tripwire.validation import register_validator
 
+# Compiled once at import - validators may run many times per process
+_USERNAME_RE = re.compile(r"^[a-zA-Z][a-zA-Z0-9_]*$")
+_WEBHOOK_RE = re.compile(r"webhook", re.IGNORECASE)
+
 
 # Define custom validator function
 def validate_username(value: str) -> tuple[bool, str]:
@@ -40,7 +41,7 @@ def validate_username(value: str) -> tuple[bool, str]:
     if len(value) < 3 or len(value) > 20:
         return False, "Username must be 3-20 characters"
 
-    if not re.match(r"^[a-zA-Z][a-zA-Z0-9_]*$", value):
+    if not _USERNAME_RE.match(value):
         return False, "Username must start with letter, contain only alphanumeric and underscores"
 
     return True, ""
@@ -51,7 +52,8 @@ def validate_webhook_url(value: str) -> tuple[bool, str]:
     if not value.startswith("https://"):
         return False, "Webhook URL must use HTTPS"
 
-    if "webhook" not in value.lower():
+    # Case-insensitive search without copying the URL via value.lower()
+    if not _WEBHOOK_RE.search(value):
         return False, "Webhook URL must contain 'webhook' in path"
 
     return True, ""
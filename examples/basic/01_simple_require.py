@@ -18,10 +18,6 @@ Or use demo mode:
 """
 
 import sys
-from pathlib import Path
-
-# Add project root to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from tripwire import TripWire
 
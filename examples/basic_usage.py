@@ -171,6 +171,16 @@ TIMEOUT: float = env.optional(
     description="Request timeout in seconds",
 )
 
+# Example 13: Batch resolution
+# require_many() resolves several variables in one pass and reports every
+# problem at once instead of stopping at the first failure
+WORKER_SETTINGS = env.require_many(
+    [
+        {"name": "WORKER_COUNT", "type": int, "default": 4, "min_val": 1},
+        {"name": "WORKER_QUEUE", "default": "default", "pattern": r"^[a-z_]+$"},
+    ]
+)
+
 
 def main() -> None:
     """Main function demonstrating the loaded configuration."""
@@ -188,6 +198,7 @@ def main() -> None:
     print(f"S3_BUCKET: {S3_BUCKET}")
     print(f"SECRET_KEY: ****** (hidden)")
     print(f"TIMEOUT: {TIMEOUT}s")
+    print(f"WORKER_SETTINGS: {WORKER_SETTINGS}")
     print("=" * 50)
     print("All environment variables loaded and validated successfully!")
 
@@ -34,14 +34,18 @@ from tripwire import env
 if __name__ == "__main__":
     # Example usage - these would normally come from .env file
     # Setting them here for demonstration purposes
-    os.environ["SUPPORT_PHONE"] = "555-123-4567"
-    os.environ["OFFICE_ZIP"] = "94102"
-    os.environ["BRAND_COLOR"] = "#FF5733"
-    os.environ["ADMIN_USERNAME"] = "admin_user"
-    os.environ["APP_VERSION"] = "1.0.0"
-    os.environ["AWS_REGION"] = "us-west-2"
-    os.environ["COMPANY_DOMAIN"] = "example.com"
-    os.environ["API_TOKEN"] = "SGVsbG8gV29ybGQ="  # "Hello World" in base64  # nosec B105
+    os.environ.update(
+        {
+            "SUPPORT_PHONE": "555-123-4567",
+            "OFFICE_ZIP": "94102",
+            "BRAND_COLOR": "#FF5733",
+            "ADMIN_USERNAME": "admin_user",
+            "APP_VERSION": "1.0.0",
+            "AWS_REGION": "us-west-2",
+            "COMPANY_DOMAIN": "example.com",
+            "API_TOKEN": "SGVsbG8gV29ybGQ=",  # "Hello World" in base64  # nosec B105
+        }
+    )
 
     # Use custom validators with format parameter
     # These will pass validation because we imported the validators above
@@ -27,10 +27,8 @@ Or use demo mode:
 """
 
 import os
+import re
 import sys
-from pathlib import Path
-
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 # Set demo mode BEFORE importing TripWire if --demo flag is present
 if "--demo" in sys.argv:
@@ -42,6 +40,9 @@ if "--demo" in sys.argv:
 
 from tripwire import TripWire
 
+# Splits on commas and strips surrounding whitespace in a single pass
+_CSV_SPLIT = re.compile(r"\s*,\s*")
+
 # Load and validate configuration
 # Use fail-fast mode to prevent Django from starting with invalid config
 env = TripWire(collect_errors=False)
@@ -53,7 +54,7 @@ DEBUG: bool = env.optional("DEBUG", default=False)
 ALLOWED_HOSTS_STR: str = env.optional("ALLOWED_HOSTS", default="localhost")
 
 # Parse comma-separated ALLOWED_HOSTS
-ALLOWED_HOSTS = [host.strip() for host in ALLOWED_HOSTS_STR.split(",")]
+ALLOWED_HOSTS = _CSV_SPLIT.split(ALLOWED_HOSTS_STR.strip())
 
 # Additional Django settings
 TIME_ZONE: str = env.optional("TIME_ZONE", default="UTC")
@@ -26,9 +26,6 @@ Requirements:
 
 import os
 import sys
-from pathlib import Path
-
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 # Set demo mode BEFORE importing TripWire if --demo flag is present
 if "--demo" in sys.argv:
@@ -51,10 +48,17 @@ API_KEY: str = env.require("API_KEY", min_length=10)
 DEBUG: bool = env.optional("DEBUG", default=False)
 PORT: int = env.optional("PORT", default=8000, min_val=1, max_val=65535)
 
-try:
-    import uvicorn
-    from fastapi import FastAPI, Request
-    from fastapi.responses import JSONResponse
+def build_app():
+    """Create the FastAPI application.
+
+    FastAPI is imported here rather than at module level so that importing this
+    module (e.g. during test collection) only validates configuration. Serve it
+    with ``uvicorn --factory examples.frameworks.fastapi_integration:build_app``.
+
+    Raises:
+        ImportError: If FastAPI is not installed
+    """
+    from fastapi import FastAPI
 
     # Create FastAPI app - only reaches here if config is valid!
     app = FastAPI(title="TripWire + FastAPI Example", debug=DEBUG)
@@ -84,24 +88,17 @@ try:
             "port": PORT,
         }
 
-    def main():
-        """Run the FastAPI application."""
-        print("✅ Configuration validated successfully!")
-        print(f"   DATABASE_URL: {DATABASE_URL[:20]}...")
-        print(f"   API_KEY: {API_KEY[:10]}...")
-        print(f"   DEBUG: {DEBUG}")
-        print(f"   PORT: {PORT}")
-        print(f"\n🚀 Starting FastAPI server on http://localhost:{PORT}")
-        print("   Try: curl http://localhost:8000/")
-        print("   Try: curl http://localhost:8000/health")
-        print("   Try: curl http://localhost:8000/config")
+    return app
 
-        uvicorn.run(app, host="0.0.0.0", port=PORT, log_level="info")  # nosec B104 - Demo server only
 
-except ImportError:
+def main():
+    """Run the FastAPI application."""
+    try:
+        import uvicorn
 
-    def main():
-        """Fallback if FastAPI not installed."""
+        app = build_app()
+    except ImportError:
+        # Fallback if FastAPI not installed
         print("✅ Configuration validated successfully!")
         print(f"   DATABASE_URL: {DATABASE_URL}")
         print(f"   API_KEY: {API_KEY}")
@@ -110,7 +107,19 @@ except ImportError:
         print("\n💡 To run the FastAPI server:")
         print("   pip install fastapi uvicorn")
         print("   python examples/frameworks/fastapi_integration.py")
-
+        return
+
+    print("✅ Configuration validated successfully!")
+    print(f"   DATABASE_URL: {DATABASE_URL[:20]}...")
+    print(f"   API_KEY: {API_KEY[:10]}...")
+    print(f"   DEBUG: {DEBUG}")
+    print(f"   PORT: {PORT}")
+    print(f"\n🚀 Starting FastAPI server on http://localhost:{PORT}")
+    print("   Try: curl http://localhost:8000/")
+    print("   Try: curl http://localhost:8000/health")
+    print("   Try: curl http://localhost:8000/config")
+
+    uvicorn.run(app, host="0.0.0.0", port=PORT, log_level="info")  # nosec B104 - Demo server only
 
 if __name__ == "__main__":
     main()
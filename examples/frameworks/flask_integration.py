@@ -25,9 +25,6 @@ Requirements:
 
 import os
 import sys
-from pathlib import Path
-
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 # Set demo mode BEFORE importing TripWire if --demo flag is present
 if "--demo" in sys.argv:
@@ -48,7 +45,16 @@ DATABASE_URL: str = env.require("DATABASE_URL")
 DEBUG: bool = env.optional("DEBUG", default=False)
 PORT: int = env.optional("PORT", default=5000, min_val=1, max_val=65535)
 
-try:
+def build_app():
+    """Create the Flask application.
+
+    Flask is imported here rather than at module level so that importing this
+    module (e.g. during test collection) only validates configuration. Serve it
+    with ``flask --app "examples.frameworks.flask_integration:build_app()" run``.
+
+    Raises:
+        ImportError: If Flask is not installed
+    """
     from flask import Flask, jsonify
 
     # Create Flask app - only if config is valid
@@ -81,23 +87,15 @@ try:
             }
         )
 
-    def main():
-        """Run the Flask application."""
-        print("✅ Configuration validated successfully!")
-        print(f"   SECRET_KEY: {SECRET_KEY[:10]}...")
-        print(f"   DATABASE_URL: {DATABASE_URL[:20]}...")
-        print(f"   DEBUG: {DEBUG}")
-        print(f"   PORT: {PORT}")
-        print(f"\n🚀 Starting Flask server on http://localhost:{PORT}")
-        print("   Try: curl http://localhost:5000/")
-        print("   Try: curl http://localhost:5000/health")
+    return app
 
-        app.run(host="0.0.0.0", port=PORT, debug=DEBUG)  # nosec B104 - Demo server only
 
-except ImportError:
-
-    def main():
-        """Fallback if Flask not installed."""
+def main():
+    """Run the Flask application."""
+    try:
+        app = build_app()
+    except ImportError:
+        # Fallback if Flask not installed
         print("✅ Configuration validated successfully!")
         print(f"   SECRET_KEY: {SECRET_KEY[:10]}...")
         print(f"   DATABASE_URL: {DATABASE_URL}")
@@ -106,7 +104,18 @@ except ImportError:
         print("\n💡 To run the Flask server:")
         print("   pip install flask")
         print("   python examples/frameworks/flask_integration.py")
-
+        return
+
+    print("✅ Configuration validated successfully!")
+    print(f"   SECRET_KEY: {SECRET_KEY[:10]}...")
+    print(f"   DATABASE_URL: {DATABASE_URL[:20]}...")
+    print(f"   DEBUG: {DEBUG}")
+    print(f"   PORT: {PORT}")
+    print(f"\n🚀 Starting Flask server on http://localhost:{PORT}")
+    print("   Try: curl http://localhost:5000/")
+    print("   Try: curl http://localhost:5000/health")
+
+    app.run(host="0.0.0.0", port=PORT, debug=DEBUG)  # nosec B104 - Demo server only
 
 if __name__ == "__main__":
     main()
@@ -15,10 +15,12 @@ Run this example:
 """
 
 import os
-import sys
-from pathlib import Path
 
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+# Manual parsing table for the "verbose fix" below: exact-case lookups, no .lower() copy
+_BOOL_MAP = {
+    **dict.fromkeys(("true", "True", "TRUE", "1", "yes", "Yes", "YES", "on", "On", "ON"), True),
+    **dict.fromkeys(("false", "False", "FALSE", "0", "no", "No", "NO", "off", "Off", "OFF"), False),
+}
 
 
 def main():
@@ -41,7 +43,7 @@ def main():
 
     # Better but still verbose
     print("\n--- Manual fix (verbose) ---")
-    DEBUG = os.getenv("DEBUG", "false").lower() in ("true", "1", "yes")
+    DEBUG = _BOOL_MAP.get(os.getenv("DEBUG", ""), False)
     print(f"DEBUG = {DEBUG} (type: {type(DEBUG).__name__})")
     print("This works but requires boilerplate everywhere")
 
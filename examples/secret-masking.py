@@ -30,11 +30,9 @@ but only Secret[str] is correct for type safety and tooling support.
 """
 
 import logging
-from contextlib import asynccontextmanager
+from contextvars import ContextVar
 from pathlib import Path
 
-from fastapi import FastAPI
-
 from tripwire import TripWire, env
 from tripwire.core.loader import DotenvFileSource
 from tripwire.plugins.sources import VaultEnvSource
@@ -47,10 +45,20 @@ from tripwire.security.logging import auto_install
 
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
 logger = logging.getLogger(__name__)
+# Log calls below pass values as %-style arguments: logging only formats them
+# when a record is actually emitted, and the redaction filter still sees the
+# final message.
 
 # Auto-install secret redaction filters on all loggers
 auto_install()
 
+_RULE = "=" * 70
+
+
+def _section(title: str) -> None:
+    """Print a section banner in a single write."""
+    print(f"\n{_RULE}\n{title}\n{_RULE}")
+
 
 # ============================================================================
 # STEP 1: Bootstrap - Load credentials from .env
@@ -60,22 +68,19 @@ auto_install()
 bootstrap_dotenv = DotenvFileSource(Path(".env"))
 bootstrap_dotenv.load()
 
-# Get Vault token (secret=True returns Secret[str])
-vault_token: Secret[str] = env.require("VAULT_TOKEN", secret=True)
-
-# Get Vault URL (also a secret - should use Secret[str])
-vault_url: Secret[str] = env.require("VAULT_URL", secret=True)
+# Get Vault token and URL in one pass (secret=True returns Secret[str])
+vault_config = env.require_many([("VAULT_TOKEN", {"secret": True}), ("VAULT_URL", {"secret": True})])
+vault_token: Secret[str] = vault_config["VAULT_TOKEN"]
+vault_url: Secret[str] = vault_config["VAULT_URL"]
 
-print("\n" + "=" * 70)
-print("STEP 1: Bootstrap Credentials")
-print("=" * 70)
+_section("STEP 1: Bootstrap Credentials")
 
 # ✅ GOOD: Print masked secret for debugging
 print(f"✅ Masked token: {vault_token}")
 # Output: ✅ Masked token: **********
 
 # ✅ GOOD: Log masked secret (safe for production)
-logger.info(f"✅ Loaded Vault token: {vault_token}")
+logger.info("✅ Loaded Vault token: %s", vault_token)
 # Log file: "Loaded Vault token: **********"
 
 # ✅ GOOD: Check secret properties without exposing value
@@ -95,9 +100,7 @@ print("\n💡 TIP: Use print(secret) for debugging - it shows masked version")
 # BONUS: Type Annotation Demonstration
 # ============================================================================
 
-print("\n" + "=" * 70)
-print("BONUS: Type Annotation Comparison")
-print("=" * 70)
+_section("BONUS: Type Annotation Comparison")
 
 print(
     """
@@ -161,9 +164,7 @@ print("   error: Incompatible types (Secret[str] vs str)")
 # STEP 2: Initialize Vault with correct source ordering
 # ============================================================================
 
-print("\n" + "=" * 70)
-print("STEP 2: Initialize Cloud Secret Manager")
-print("=" * 70)
+_section("STEP 2: Initialize Cloud Secret Manager")
 
 # ✅ GOOD: Unwrap secret ONLY when passing to authenticated service
 vault = VaultEnvSource(
@@ -186,9 +187,7 @@ print("   (Vault secrets override .env values)")
 # STEP 3: Load application secrets
 # ============================================================================
 
-print("\n" + "=" * 70)
-print("STEP 3: Load Application Secrets")
-print("=" * 70)
+_section("STEP 3: Load Application Secrets")
 
 # Load secrets from Vault (with proper type annotations - Secret[str] for all secrets)
 github_token: Secret[str] = env_tripwire.require("github_token", secret=True)
@@ -200,17 +199,15 @@ print(f"✅ Database URL: {database_url}")
 # Output shows: ********** for both
 
 # ✅ GOOD: Log secret usage (automatically redacted)
-logger.info(f"✅ Loaded GitHub token: {github_token}")
-logger.info(f"✅ Loaded database URL: {database_url}")
+logger.info("✅ Loaded GitHub token: %s", github_token)
+logger.info("✅ Loaded database URL: %s", database_url)
 
 
 # ============================================================================
 # STEP 4: Debugging Examples (What to do vs what NOT to do)
 # ============================================================================
 
-print("\n" + "=" * 70)
-print("STEP 4: Debugging Best Practices")
-print("=" * 70)
+_section("STEP 4: Debugging Best Practices")
 
 print("\n--- ✅ GOOD PRACTICES ---")
 
@@ -253,9 +250,7 @@ print("   → Persists secrets on disk!")
 # STEP 5: Legitimate Uses of get_secret_value()
 # ============================================================================
 
-print("\n" + "=" * 70)
-print("STEP 5: Legitimate Uses of get_secret_value()")
-print("=" * 70)
+_section("STEP 5: Legitimate Uses of get_secret_value()")
 
 # ✅ GOOD: Pass to authenticated API client
 print("✅ GOOD: Pass to API client")
@@ -279,15 +274,13 @@ print("\n💡 TIP: Only unwrap secrets when passing to authenticated services")
 # STEP 6: Logging Integration (Defense-in-Depth)
 # ============================================================================
 
-print("\n" + "=" * 70)
-print("STEP 6: Logging Protection (Defense-in-Depth)")
-print("=" * 70)
+_section("STEP 6: Logging Protection (Defense-in-Depth)")
 
 # ✅ EVEN IF you accidentally unwrap in logging, it's STILL protected!
-logger.info(f"✅ Token (wrapped): {github_token}")
+logger.info("✅ Token (wrapped): %s", github_token)
 # Log shows: "Token (wrapped): **********"
 
-logger.info(f"✅ Token (unwrapped): {github_token.get_secret_value()}")
+logger.info("✅ Token (unwrapped): %s", github_token.get_secret_value())
 # Log STILL shows: "Token (unwrapped): **********"
 # This is DEFENSE-IN-DEPTH! Even mistakes are caught.
 
@@ -299,9 +292,7 @@ print("   Check your log files - secrets are redacted!")
 # STEP 7: Exception Handling
 # ============================================================================
 
-print("\n" + "=" * 70)
-print("STEP 7: Exception Handling")
-print("=" * 70)
+_section("STEP 7: Exception Handling")
 
 try:
     # Simulate error with secret in message
@@ -316,58 +307,119 @@ except ValueError as e:
 # STEP 8: FastAPI Integration Example
 # ============================================================================
 
-print("\n" + "=" * 70)
-print("STEP 8: FastAPI Integration")
-print("=" * 70)
+_section("STEP 8: FastAPI Integration")
 
 
-# Modern FastAPI lifespan event handler (replaces deprecated on_event)
-@asynccontextmanager
-async def lifespan(_app: FastAPI):
-    """Application lifespan - startup and shutdown.
+# Request-scoped access to the GitHub token. The loaded secret is the default, so
+# every request sees it; a request (e.g. for one tenant) can override it with
+# GITHUB_TOKEN.set(...) without affecting requests running concurrently.
+GITHUB_TOKEN: ContextVar[Secret[str]] = ContextVar("github_token", default=github_token)
 
-    Args:
-        _app: FastAPI app instance (unused, required by FastAPI lifespan signature)
-    """
-    # Startup
-    logger.info("✅ Application starting with validated secrets")
-    logger.info(f"✅ GitHub token configured: {bool(github_token)}")
-    logger.info(f"✅ Database configured: {bool(database_url)}")
 
-    yield  # Application runs
+def get_github_token() -> Secret[str]:
+    """FastAPI dependency returning the GitHub token for the current request."""
+    return GITHUB_TOKEN.get()
 
-    # Shutdown (optional cleanup)
-    logger.info("✅ Application shutting down")
 
+def _secret_default(obj: object) -> str:
+    """orjson fallback serializer: Secret values always serialize as the mask."""
+    if isinstance(obj, Secret):
+        return str(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
 
-app = FastAPI(title="TripWire Secret Protection Demo", lifespan=lifespan)  # Use modern lifespan handler
 
+def build_app():
+    """Create the FastAPI demo application.
 
-@app.get("/health")
-async def health():
-    """Health check endpoint."""
-    return {
-        "status": "healthy",
-        "secrets_configured": {
-            "github": bool(github_token),
-            "database": bool(database_url),
-            "vault": bool(vault_token),
-        },
-    }
+    FastAPI is imported here rather than at module level so the secret
+    protection steps above run without it installed.
 
-
-@app.get("/api/github")
-async def github_api():
-    """Example API endpoint using secrets correctly."""
-    # ✅ GOOD: Unwrap only when calling authenticated service
-    # github_client = GitHubClient(token=github_token.get_secret_value())
-    # data = github_client.get_user()
-
-    logger.info("✅ GitHub API called with authenticated token")
-    return {"message": "GitHub API integration example"}
-
-
-print("✅ FastAPI app configured with modern lifespan handler")
+    Raises:
+        ImportError: If FastAPI is not installed
+    """
+    from contextlib import asynccontextmanager
+
+    from fastapi import Depends, FastAPI
+    from fastapi.responses import JSONResponse
+
+    # Render responses with orjson when it is installed (pip install orjson).
+    # Any Secret that reaches the JSON layer is written as the mask.
+    try:
+        import orjson
+    except ImportError:
+        response_class = JSONResponse
+    else:
+
+        class MaskedORJSONResponse(JSONResponse):
+            def render(self, content: object) -> bytes:
+                return orjson.dumps(content, default=_secret_default)
+
+        response_class = MaskedORJSONResponse
+
+    # Modern FastAPI lifespan event handler (replaces deprecated on_event)
+    @asynccontextmanager
+    async def lifespan(_app: FastAPI):
+        """Application lifespan - startup and shutdown.
+
+        Args:
+            _app: FastAPI app instance (unused, required by FastAPI lifespan signature)
+        """
+        # Startup
+        logger.info("✅ Application starting with validated secrets")
+        logger.info("✅ GitHub token configured: %s", bool(GITHUB_TOKEN.get()))
+        logger.info("✅ Database configured: %s", bool(database_url))
+
+        yield  # Application runs
+
+        # Shutdown (optional cleanup)
+        logger.info("✅ Application shutting down")
+
+    app = FastAPI(
+        title="TripWire Secret Protection Demo",
+        lifespan=lifespan,  # Use modern lifespan handler
+        default_response_class=response_class,
+    )
+
+    @app.get("/health")
+    async def health():
+        """Health check endpoint."""
+        return {
+            "status": "healthy",
+            "secrets_configured": {
+                "github": bool(GITHUB_TOKEN.get()),
+                "database": bool(database_url),
+                "vault": bool(vault_token),
+            },
+        }
+
+    @app.get("/api/github")
+    async def github_api(token: Secret[str] = Depends(get_github_token)):
+        """Example API endpoint using secrets correctly."""
+        # ✅ GOOD: Unwrap only when calling authenticated service
+        # github_client = GitHubClient(token=token.get_secret_value())
+        # data = github_client.get_user()
+
+        logger.info("✅ GitHub API called with authenticated token: %s", bool(token))
+        return {"message": "GitHub API integration example", "token_configured": bool(token)}
+
+    return app
+
+
+def __getattr__(name: str):
+    """Build the FastAPI app on first access to ``app`` (as ``uvicorn main:app`` does)."""
+    if name == "app":
+        app = globals()["app"] = build_app()
+        return app
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+if __name__ == "__main__":
+    try:
+        build_app()
+    except ImportError:
+        print("ℹ️  FastAPI not installed - skipping app setup (pip install fastapi)")
+    else:
+        print("✅ FastAPI app configured with modern lifespan handler")
 print("\n💡 Run with: uvicorn main:app --reload")
 
 
@@ -375,9 +427,7 @@ print("\n💡 Run with: uvicorn main:app --reload")
 # Summary
 # ============================================================================
 
-print("\n" + "=" * 70)
-print("SUMMARY: TripWire Secret Protection")
-print("=" * 70)
+_section("SUMMARY: TripWire Secret Protection")
 
 print(
     """
@@ -419,6 +469,4 @@ TripWire's filter will STILL redact it!
 """
 )
 
-print("=" * 70)
-print("✅ All secrets protected - ready for production!")
-print("=" * 70 + "\n")
+print(f"{_RULE}\n✅ All secrets protected - ready for production!\n{_RULE}\n")
@@ -17,8 +17,7 @@ Version 0.9.0+ uses the modern TripWireV2 implementation by default.
 The legacy implementation is available as TripWireLegacy for backward compatibility.
 """
 
-# Legacy implementation (deprecated, will be removed in v1.0.0)
-from tripwire._core_legacy import TripWireLegacy
+from typing import TYPE_CHECKING, Any
 
 # Modern implementation (v0.9.0+)
 from tripwire.core import TripWire, TripWireV2, env
@@ -33,8 +32,27 @@ from tripwire.exceptions import (
 )
 from tripwire.validation import validator
 
+if TYPE_CHECKING:
+    # Legacy implementation (deprecated, will be removed in v1.0.0)
+    from tripwire._core_legacy import TripWireLegacy
+
 __version__ = "0.13.0"
 
+
+def __getattr__(name: str) -> Any:
+    """Lazily import rarely used attributes (PEP 562).
+
+    The legacy implementation is only loaded when TripWireLegacy is
+    accessed, so ``import tripwire`` doesn't pay for it.
+    """
+    if name == "TripWireLegacy":
+        from tripwire._core_legacy import TripWireLegacy
+
+        globals()[name] = TripWireLegacy
+        return TripWireLegacy
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 __all__ = [
     # Core (Modern Implementation)
     "TripWire",  # Modern implementation (TripWireV2 alias, default)
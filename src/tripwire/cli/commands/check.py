@@ -46,11 +46,6 @@ def check(env_file: str | Path, example: str | Path, strict: bool, output_json:
     env_path = Path(env_file)
     example_path = Path(example)
 
-    # Validate files exist
-    if not example_path.exists():
-        console.print(f"[red]Error:[/red] {example} not found")
-        sys.exit(1)
-
     # Compare files
     missing, extra, common = compare_env_files(env_path, example_path)
 
@@ -6,6 +6,7 @@ environment variable usage.
 
 import re
 import sys
+from operator import attrgetter
 from pathlib import Path
 from typing import Any
 
@@ -130,6 +131,15 @@ def _is_secret(var_name: str, value: str) -> bool:
     return len(matches) > 0
 
 
+def _is_up_to_date(existing: str, generated: str) -> bool:
+    """Compare file contents, ignoring leading/trailing whitespace.
+
+    The exact comparison runs first: it is the common case for a file we wrote
+    ourselves and avoids allocating stripped copies of both strings.
+    """
+    return existing == generated or existing.strip() == generated.strip()
+
+
 def _generate_from_schema(output: str, check: bool, force: bool, schema_file: str) -> None:
     """Generate .env.example from .tripwire.toml schema."""
     from tripwire.schema import load_schema
@@ -166,12 +176,13 @@ def _generate_from_schema(output: str, check: bool, force: bool, schema_file: st
     # Check mode: compare with existing file
     if check:
         console.print("[yellow]Checking if output is up to date...[/yellow]")
-        if not output_path.exists():
+        try:
+            existing_content = output_path.read_text()
+        except FileNotFoundError:
             console.print(f"[red][X][/red] {output} does not exist")
             sys.exit(1)
 
-        existing_content = output_path.read_text()
-        if existing_content.strip() == generated_content.strip():
+        if _is_up_to_date(existing_content, generated_content):
             console.print(f"[green][OK][/green] {output} is up to date")
         else:
             console.print(f"[red][X][/red] {output} is out of date")
@@ -238,6 +249,7 @@ def generate(output: str | Path, check: bool, force: bool) -> None:
         deduplicate_variables,
         format_var_for_env_example,
         scan_directory,
+        split_required,
     )
 
     console.print("[yellow]Scanning Python files for environment variables...[/yellow]")
@@ -271,20 +283,19 @@ def generate(output: str | Path, check: bool, force: bool) -> None:
 """
 
     # Separate required and optional variables
-    required_vars = [v for v in unique_vars.values() if v.required]
-    optional_vars = [v for v in unique_vars.values() if not v.required]
+    required_vars, optional_vars = split_required(unique_vars)
 
     sections = []
 
     if required_vars:
         sections.append("# Required Variables")
-        for var in sorted(required_vars, key=lambda v: v.name):
+        for var in sorted(required_vars, key=attrgetter("name")):
             sections.append(format_var_for_env_example(var))
             sections.append("")
 
     if optional_vars:
         sections.append("# Optional Variables")
-        for var in sorted(optional_vars, key=lambda v: v.name):
+        for var in sorted(optional_vars, key=attrgetter("name")):
             sections.append(format_var_for_env_example(var))
             sections.append("")
 
@@ -295,12 +306,13 @@ def generate(output: str | Path, check: bool, force: bool) -> None:
     # Check mode: compare with existing file
     if check:
         console.print("[yellow]Checking if .env.example is up to date...[/yellow]")
-        if not output_path.exists():
+        try:
+            existing_content = output_path.read_text()
+        except FileNotFoundError:
             console.print(f"[red][X][/red] {output} does not exist")
             sys.exit(1)
 
-        existing_content = output_path.read_text()
-        if existing_content.strip() == generated_content.strip():
+        if _is_up_to_date(existing_content, generated_content):
             console.print("[green][OK][/green] .env.example is up to date")
         else:
             console.print("[red][X][/red] .env.example is out of date")
@@ -11,9 +11,30 @@ from pathlib import Path
 import click
 
 from tripwire.branding import LOGO_BANNER
-from tripwire.cli.templates import PROJECT_TEMPLATES
+from tripwire.cli.templates import (
+    PROJECT_TEMPLATES,
+    RENDERED_TEMPLATES,
+    SECRET_KEY_PLACEHOLDER,
+)
 from tripwire.cli.utils.console import console
 
+_GLOB_CHARS = frozenset("*?[")
+
+# Printed once at the end of init; a single print parses the markup and writes in one go
+_NEXT_STEPS = (
+    "\n[bold green]Setup complete![/bold green]\n\n"
+    "Next steps:\n"
+    "  1. Edit .env with your configuration values\n"
+    "  2. Import in your code: [cyan]from tripwire import env[/cyan]\n"
+    "  3. Use variables: [cyan]API_KEY = env.require('API_KEY')[/cyan]\n"
+    "\nFor help: [cyan]tripwire --help[/cyan]\n"
+)
+
+
+def _has_glob(pattern: str) -> bool:
+    """Return True if a .gitignore pattern contains glob metacharacters."""
+    return not _GLOB_CHARS.isdisjoint(pattern)
+
 
 @click.command()
 @click.option(
@@ -31,103 +52,80 @@ def init(project_type: str) -> None:
     console.print(f"[cyan]{LOGO_BANNER}[/cyan]")
     console.print("[bold cyan]Initializing TripWire in your project...[/bold cyan]\n")
 
-    # Generate a secure random key for SECRET_KEY in .env only
-    random_secret_key = secrets.token_urlsafe(32)
-
-    # Helper function to generate templates with secret injection
-    def get_template(project_type: str, inject_secret: bool = False) -> str:
-        """Generate environment template with optional secret injection.
-
-        Args:
-            project_type: Type of project (web, cli, data, other)
-            inject_secret: If True, use real random secret; if False, use placeholder
-
-        Returns:
-            Formatted template string with secrets injected appropriately
-        """
-        # Get template data from module-level constant
-        template_data = PROJECT_TEMPLATES.get(project_type, PROJECT_TEMPLATES["other"])
-
-        # Build secret section based on injection mode
-        if inject_secret:
-            # Real random secret for .env file
-            comment = template_data["secret_comment"]
-            secret_line = f"SECRET_KEY={random_secret_key}" if comment else ""
-            secret_section = f"{comment}\n{secret_line}" if comment else secret_line
-        else:
-            # Placeholder for .env.example file
-            comment = template_data["placeholder_comment"]
-            secret_line = "SECRET_KEY=CHANGE_ME_TO_RANDOM_SECRET_KEY" if comment else ""
-            secret_section = f"{comment}\n{secret_line}" if comment else secret_line
-
-        return template_data["base"].format(secret_section=secret_section)
+    # Templates are pre-rendered at import; only the random key is filled in here
+    template_type = project_type if project_type in PROJECT_TEMPLATES else "other"
 
     # Create .env file (with real random secrets)
-    env_path = Path(".env")
-    if env_path.exists():
-        console.print("[yellow][!] .env already exists, skipping...[/yellow]")
-    else:
-        env_path.write_text(get_template(project_type, inject_secret=True))
+    # Exclusive create ("x") never overwrites an existing .env, even one created concurrently
+    try:
+        with Path(".env").open("x") as f:
+            # Generate a secure random key for SECRET_KEY in .env only, and only when .env is written
+            random_secret_key = secrets.token_urlsafe(32)
+            f.write(RENDERED_TEMPLATES[(template_type, True)].replace(SECRET_KEY_PLACEHOLDER, random_secret_key))
         console.print("[green][OK] Created .env[/green]")
+    except FileExistsError:
+        console.print("[yellow][!] .env already exists, skipping...[/yellow]")
 
     # Create .env.example (with placeholder secrets only)
-    example_path = Path(".env.example")
-    if example_path.exists():
-        console.print("[yellow][!] .env.example already exists, skipping...[/yellow]")
-    else:
-        # Use placeholder template for .env.example to avoid committing real secrets
-        # Real random secrets only go in .env (which is gitignored)
-        example_content = get_template(project_type, inject_secret=False)
-
-        # Add header comment to .env.example
-        example_with_header = f"""# TripWire Environment Variables Template
+    try:
+        with Path(".env.example").open("x") as f:
+            # Use placeholder template for .env.example to avoid committing real secrets
+            # Real random secrets only go in .env (which is gitignored)
+            example_content = RENDERED_TEMPLATES[(template_type, False)]
+
+            # Add header comment to .env.example
+            example_with_header = f"""# TripWire Environment Variables Template
 # Copy this file to .env and fill in your actual values:
 #   cp .env.example .env
 #
 # Never commit .env to version control!
 
 {example_content}"""
-        example_path.write_text(example_with_header)
+            f.write(example_with_header)
         console.print("[green][OK] Created .env.example[/green]")
+    except FileExistsError:
+        console.print("[yellow][!] .env.example already exists, skipping...[/yellow]")
 
     # Update .gitignore
     gitignore_path = Path(".gitignore")
-    gitignore_content = gitignore_path.read_text() if gitignore_path.exists() else ""
+    try:
+        gitignore_content = gitignore_path.read_text()
+    except FileNotFoundError:
+        gitignore_content = ""
 
     # Check if .env is already protected by any pattern
     # Use fnmatch to properly handle gitignore glob patterns:
     #   .env*    matches .env (and .envrc, .environment, etc.)
     #   .env.*   matches .env.local, .env.prod (but NOT .env)
     #   .env     matches .env exactly
-    gitignore_lines = [
-        line.strip() for line in gitignore_content.splitlines() if line.strip() and not line.strip().startswith("#")
-    ]
-    has_env_entry = any(fnmatch.fnmatch(".env", pattern) for pattern in gitignore_lines)
+    # A bare ".env" line is found with one substring search; otherwise lines are
+    # checked one by one (literal lines directly, fnmatch only for glob lines).
+    has_env_entry = "\n.env\n" in f"\n{gitignore_content}\n"
+    if not has_env_entry:
+        for line in gitignore_content.splitlines():
+            pattern = line.strip()
+            if not pattern or pattern[0] == "#":
+                continue
+            if pattern == ".env" or (_has_glob(pattern) and fnmatch.fnmatch(".env", pattern)):
+                has_env_entry = True
+                break
 
     if not has_env_entry:
+        # Add proper spacing based on whether file exists and has content
+        if gitignore_content:
+            separator = "\n" if gitignore_content.endswith("\n") else "\n\n"
+        else:
+            # New file - no leading newline
+            separator = ""
+
         with gitignore_path.open("a") as f:
-            # Add proper spacing based on whether file exists and has content
-            if gitignore_content:
-                if not gitignore_content.endswith("\n"):
-                    f.write("\n")
-                f.write("\n# Environment variables (TripWire)\n")
-            else:
-                # New file - no leading newline
-                f.write("# Environment variables (TripWire)\n")
-
-            f.write(".env\n")
-            f.write(".env.local\n")
+            f.write(f"{separator}# Environment variables (TripWire)\n.env\n.env.local\n")
         console.print("[green][OK] Updated .gitignore[/green]")
     else:
         console.print("[yellow][!] .gitignore already contains .env entries[/yellow]")
 
     # Success message
-    console.print("\n[bold green]Setup complete![/bold green]\n")
-    console.print("Next steps:")
-    console.print("  1. Edit .env with your configuration values")
-    console.print("  2. Import in your code: [cyan]from tripwire import env[/cyan]")
-    console.print("  3. Use variables: [cyan]API_KEY = env.require('API_KEY')[/cyan]")
-    console.print("\nFor help: [cyan]tripwire --help[/cyan]\n")
+    console.print(_NEXT_STEPS)
 
 
 __all__ = ["init"]
@@ -8,12 +8,12 @@ import json
 import re
 import subprocess
 import sys
+from operator import attrgetter
 from pathlib import Path
 from typing import Any, Dict, Optional
 
 import click
 from rich.panel import Panel
-from rich.syntax import Syntax
 from rich.table import Table
 
 from tripwire.branding import LOGO_BANNER, get_status_icon
@@ -1444,7 +1444,7 @@ def schema_to_docs(schema_file: str, format: str, output: Optional[str]) -> None
         lines.append("| Variable | Type | Description | Validation |")
         lines.append("|----------|------|-------------|------------|")
 
-        for var in sorted(required_vars, key=lambda v: v.name):
+        for var in sorted(required_vars, key=attrgetter("name")):
             validation_parts = []
             if var.format:
                 validation_parts.append(f"Format: {var.format}")
@@ -1467,7 +1467,7 @@ def schema_to_docs(schema_file: str, format: str, output: Optional[str]) -> None
         lines.append("| Variable | Type | Default | Description | Validation |")
         lines.append("|----------|------|---------|-------------|------------|")
 
-        for var in sorted(optional_vars, key=lambda v: v.name):
+        for var in sorted(optional_vars, key=attrgetter("name")):
             validation_parts = []
             if var.format:
                 validation_parts.append(f"Format: {var.format}")
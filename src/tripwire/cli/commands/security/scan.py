@@ -101,27 +101,28 @@ def scan(strict: bool, depth: int) -> None:
         if git_findings_list:
             from tripwire.secrets import SecretType
 
-            seen: set[tuple[str, str]] = set()
+            # Keep the first finding per (variable, type); later commits only repeat it
+            unique_findings: dict[tuple[str, str], dict[str, str]] = {}
             for git_finding in git_findings_list:
-                key = (git_finding["variable"], git_finding["type"])
-                if key not in seen:
-                    seen.add(key)
-                    # Create a proper SecretMatch object for git findings
-                    try:
-                        secret_type = SecretType(git_finding["type"])
-                    except ValueError:
-                        secret_type = SecretType.GENERIC_API_KEY
-
-                    all_findings.append(
-                        SecretMatch(
-                            secret_type=secret_type,
-                            variable_name=git_finding["variable"],
-                            value="***",
-                            line_number=0,
-                            severity=git_finding["severity"],
-                            recommendation=f"Found in commit {git_finding['commit']}. Rotate this secret immediately.",
-                        )
+                unique_findings.setdefault((git_finding["variable"], git_finding["type"]), git_finding)
+
+            for (variable_name, type_value), git_finding in unique_findings.items():
+                # Create a proper SecretMatch object for git findings
+                try:
+                    secret_type = SecretType(type_value)
+                except ValueError:
+                    secret_type = SecretType.GENERIC_API_KEY
+
+                all_findings.append(
+                    SecretMatch(
+                        secret_type=secret_type,
+                        variable_name=variable_name,
+                        value="***",
+                        line_number=0,
+                        severity=git_finding["severity"],
+                        recommendation=f"Found in commit {git_finding['commit']}. Rotate this secret immediately.",
                     )
+                )
 
         # Display findings table
         table = Table(title="Detected Secrets", show_header=True, header_style="bold red")
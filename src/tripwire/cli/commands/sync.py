@@ -1,6 +1,5 @@
 """Sync command for TripWire CLI."""
 
-import sys
 from pathlib import Path
 
 import click
@@ -41,18 +40,17 @@ def sync(env_file: str | Path, example: str | Path, dry_run: bool, interactive:
     Updates your .env file to match the structure of .env.example,
     adding missing variables and optionally removing extra ones.
     """
-    from tripwire.parser import compare_env_files, merge_env_files, parse_env_file
+    from tripwire.parser import EnvFileParser, compare_env_vars, merge_env_entries, parse_env_file
 
     env_path = Path(env_file)
     example_path = Path(example)
 
-    # Validate example file exists
-    if not example_path.exists():
-        console.print(f"[red]Error:[/red] {example} not found")
-        sys.exit(1)
+    # Parse each file once; the entries feed both the comparison and the merge
+    env_entries = EnvFileParser().parse_file(env_path) if env_path.exists() else {}
+    example_vars = parse_env_file(example_path)
 
     # Compare files
-    missing, extra, _ = compare_env_files(env_path, example_path)
+    missing, extra, _ = compare_env_vars({key: entry.value for key, entry in env_entries.items()}, example_vars)
 
     if not missing and not extra:
         status = get_status_icon("valid")
@@ -92,11 +90,10 @@ def sync(env_file: str | Path, example: str | Path, dry_run: bool, interactive:
             return
 
     # Get values from example file
-    example_vars = parse_env_file(example_path)
     new_vars = {var: example_vars[var] for var in missing}
 
     # Merge into env file
-    merged_content = merge_env_files(env_path, new_vars, preserve_existing=True)
+    merged_content = merge_env_entries(env_entries, new_vars, preserve_existing=True)
 
     # Write updated file
     env_path.write_text(merged_content)
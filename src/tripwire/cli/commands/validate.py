@@ -25,7 +25,7 @@ def validate(env_file: str | Path) -> None:
     Loads and validates all environment variables to ensure they
     meet requirements before starting the application.
     """
-    from tripwire.scanner import deduplicate_variables, scan_directory
+    from tripwire.scanner import deduplicate_variables, scan_directory, split_required
 
     env_path = Path(env_file)
 
@@ -53,8 +53,7 @@ def validate(env_file: str | Path) -> None:
 
     # Check each required variable
     unique_vars = deduplicate_variables(variables)
-    required_vars = [v for v in unique_vars.values() if v.required]
-    optional_vars = [v for v in unique_vars.values() if not v.required]
+    required_vars, optional_vars = split_required(unique_vars)
 
     console.print(
         f"Found {len(unique_vars)} variable(s): {len(required_vars)} required, {len(optional_vars)} optional\n"
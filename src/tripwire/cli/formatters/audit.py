@@ -4,19 +4,21 @@ Displays git history audit results in various visual formats.
 """
 
 from collections import defaultdict
+from typing import TYPE_CHECKING
 
 from rich.console import Console
 from rich.panel import Panel
-from rich.syntax import Syntax
 from rich.tree import Tree
 
 from tripwire.branding import get_status_icon
-from tripwire.git_audit import SecretTimeline, generate_remediation_steps
-from tripwire.secrets import SecretMatch
+
+if TYPE_CHECKING:
+    from tripwire.git_audit import SecretTimeline
+    from tripwire.secrets import SecretMatch
 
 
 def display_combined_timeline(
-    results: list[tuple[SecretMatch, SecretTimeline]],
+    results: list[tuple["SecretMatch", "SecretTimeline"]],
     console: Console,
 ) -> None:
     """Display combined visual timeline for multiple secrets.
@@ -80,7 +82,7 @@ def display_combined_timeline(
 
 def display_single_audit_result(
     secret_name: str,
-    timeline: SecretTimeline,
+    timeline: "SecretTimeline",
     console: Console,
 ) -> None:
     """Display audit results for a single secret.
@@ -90,6 +92,10 @@ def display_single_audit_result(
         timeline: SecretTimeline object
         console: Rich console instance
     """
+    from rich.syntax import Syntax
+
+    from tripwire.git_audit import generate_remediation_steps
+
     # No leaks found
     if timeline.total_occurrences == 0:
         status = get_status_icon("valid")
@@ -5,9 +5,122 @@ environment variable specifications.
 """
 
 import json
+from dataclasses import dataclass
+from operator import attrgetter
+from typing import Any
 
 from tripwire.scanner import EnvVarInfo
 
+# Reused across calls; the document is built fresh here, so the circular-reference scan is unnecessary
+_JSON_ENCODER = json.JSONEncoder(indent=2, check_circular=False)
+
+_MARKDOWN_HEADER = (
+    "# Environment Variables",
+    "",
+    "This document describes all environment variables used in this project.",
+    "",
+    "## Required Variables",
+    "",
+    "| Variable | Type | Description | Validation |",
+    "|----------|------|-------------|------------|",
+)
+
+_MARKDOWN_USAGE = (
+    "",
+    "## Usage",
+    "",
+    "To use these variables in your Python code:",
+    "",
+    "```python",
+    "from tripwire import env",
+    "",
+    "# Required variable",
+    "api_key = env.require('API_KEY', description='API key for service')",
+    "",
+    "# Optional variable with default",
+    "debug = env.optional('DEBUG', default=False, type=bool)",
+    "```",
+    "",
+    "---",
+    "",
+    "*Generated by [TripWire](https://github.com/Daily-Nerd/TripWire)*",
+)
+
+_HTML_HEADER = """<!DOCTYPE html>
+<html>
+<head>
+    <title>Environment Variables Documentation</title>
+    <style>
+        body { font-family: Arial, sans-serif; max-width: 1200px; margin: 0 auto; padding: 20px; }
+        h1 { color: #333; }
+        h2 { color: #555; border-bottom: 2px solid #ddd; padding-bottom: 10px; }
+        table { width: 100%; border-collapse: collapse; margin: 20px 0; }
+        th, td { padding: 12px; text-align: left; border: 1px solid #ddd; }
+        th { background-color: #f5f5f5; font-weight: bold; }
+        tr:nth-child(even) { background-color: #f9f9f9; }
+        code { background-color: #f5f5f5; padding: 2px 6px; border-radius: 3px; }
+        .required { color: #c00; }
+        .optional { color: #060; }
+    </style>
+</head>
+<body>
+    <h1>Environment Variables</h1>
+    <p>This document describes all environment variables used in this project.</p>
+"""
+
+_HTML_FOOTER = """
+    <hr>
+    <p><em>Generated by <a href="https://github.com/Daily-Nerd/TripWire">TripWire</a></em></p>
+</body>
+</html>
+"""
+
+
+@dataclass(frozen=True)
+class _DocRow:
+    """Format-independent cell values for one variable's documentation row."""
+
+    name: str
+    var_type: str
+    description: str
+    default: str
+    validation: str
+    validation_with_pattern: str
+
+
+def _prepare_rows(variables: dict[str, EnvVarInfo]) -> tuple[list[_DocRow], list[_DocRow]]:
+    """Build (required, optional) rows sorted by name, with every cell pre-rendered.
+
+    Each variable is visited once; renderers only assemble format-specific markup.
+    """
+    from tripwire.scanner import format_default_value
+
+    required: list[_DocRow] = []
+    optional: list[_DocRow] = []
+    for var in sorted(variables.values(), key=attrgetter("name")):
+        parts = []
+        if var.format:
+            parts.append(f"Format: {var.format}")
+        if var.choices:
+            parts.append(f"Choices: {', '.join(map(str, var.choices))}")
+        validation = "; ".join(parts) if parts else "-"
+        if var.pattern:
+            parts.append(f"Pattern: `{var.pattern}`")
+            validation_with_pattern = "; ".join(parts)
+        else:
+            validation_with_pattern = validation
+
+        row = _DocRow(
+            name=var.name,
+            var_type=var.var_type,
+            description=var.description or "-",
+            default="-" if var.required or var.default is None else (format_default_value(var.default) or "-"),
+            validation=validation,
+            validation_with_pattern=validation_with_pattern,
+        )
+        (required if var.required else optional).append(row)
+    return required, optional
+
 
 def generate_markdown_docs(variables: dict[str, EnvVarInfo]) -> str:
     """Generate markdown documentation.
@@ -18,90 +131,36 @@ def generate_markdown_docs(variables: dict[str, EnvVarInfo]) -> str:
     Returns:
         Markdown formatted documentation
     """
-    from tripwire.scanner import format_default_value
-
-    lines = [
-        "# Environment Variables",
-        "",
-        "This document describes all environment variables used in this project.",
-        "",
-        "## Required Variables",
-        "",
-        "| Variable | Type | Description | Validation |",
-        "|----------|------|-------------|------------|",
-    ]
+    lines = list(_MARKDOWN_HEADER)
 
-    required_vars = sorted([v for v in variables.values() if v.required], key=lambda v: v.name)
+    required_rows, optional_rows = _prepare_rows(variables)
+    append = lines.append
 
-    if not required_vars:
-        lines.append("| - | - | - | - |")
+    if not required_rows:
+        append("| - | - | - | - |")
     else:
-        for var in required_vars:
-            validation = []
-            if var.format:
-                validation.append(f"Format: {var.format}")
-            if var.choices:
-                validation.append(f"Choices: {', '.join(str(c) for c in var.choices)}")
-            if var.pattern:
-                validation.append(f"Pattern: `{var.pattern}`")
-
-            validation_str = "; ".join(validation) if validation else "-"
-            desc = var.description or "-"
-
-            lines.append(f"| `{var.name}` | {var.var_type} | {desc} | {validation_str} |")
+        for row in required_rows:
+            append(f"| `{row.name}` | {row.var_type} | {row.description} | {row.validation_with_pattern} |")
 
     lines.extend(
-        [
+        (
             "",
             "## Optional Variables",
             "",
             "| Variable | Type | Default | Description | Validation |",
             "|----------|------|---------|-------------|------------|",
-        ]
+        )
     )
 
-    optional_vars = sorted([v for v in variables.values() if not v.required], key=lambda v: v.name)
-
-    if not optional_vars:
-        lines.append("| - | - | - | - | - |")
+    if not optional_rows:
+        append("| - | - | - | - | - |")
     else:
-        for var in optional_vars:
-            validation = []
-            if var.format:
-                validation.append(f"Format: {var.format}")
-            if var.choices:
-                validation.append(f"Choices: {', '.join(str(c) for c in var.choices)}")
-            if var.pattern:
-                validation.append(f"Pattern: `{var.pattern}`")
+        for row in optional_rows:
+            append(
+                f"| `{row.name}` | {row.var_type} | `{row.default}` | {row.description} | {row.validation_with_pattern} |"
+            )
 
-            validation_str = "; ".join(validation) if validation else "-"
-            desc = var.description or "-"
-            default_str = format_default_value(var.default) or "-"
-
-            lines.append(f"| `{var.name}` | {var.var_type} | `{default_str}` | {desc} | {validation_str} |")
-
-    lines.extend(
-        [
-            "",
-            "## Usage",
-            "",
-            "To use these variables in your Python code:",
-            "",
-            "```python",
-            "from tripwire import env",
-            "",
-            "# Required variable",
-            "api_key = env.require('API_KEY', description='API key for service')",
-            "",
-            "# Optional variable with default",
-            "debug = env.optional('DEBUG', default=False, type=bool)",
-            "```",
-            "",
-            "---",
-            "",
-            "*Generated by [TripWire](https://github.com/Daily-Nerd/TripWire)*",
-        ]
-    )
+    lines.extend(_MARKDOWN_USAGE)
 
     return "\n".join(lines)
 
@@ -115,75 +174,37 @@ def generate_html_docs(variables: dict[str, EnvVarInfo]) -> str:
     Returns:
         HTML formatted documentation
     """
-    from tripwire.scanner import format_default_value
-
-    required_vars = sorted([v for v in variables.values() if v.required], key=lambda v: v.name)
-    optional_vars = sorted([v for v in variables.values() if not v.required], key=lambda v: v.name)
-
-    html = """<!DOCTYPE html>
-<html>
-<head>
-    <title>Environment Variables Documentation</title>
-    <style>
-        body { font-family: Arial, sans-serif; max-width: 1200px; margin: 0 auto; padding: 20px; }
-        h1 { color: #333; }
-        h2 { color: #555; border-bottom: 2px solid #ddd; padding-bottom: 10px; }
-        table { width: 100%; border-collapse: collapse; margin: 20px 0; }
-        th, td { padding: 12px; text-align: left; border: 1px solid #ddd; }
-        th { background-color: #f5f5f5; font-weight: bold; }
-        tr:nth-child(even) { background-color: #f9f9f9; }
-        code { background-color: #f5f5f5; padding: 2px 6px; border-radius: 3px; }
-        .required { color: #c00; }
-        .optional { color: #060; }
-    </style>
-</head>
-<body>
-    <h1>Environment Variables</h1>
-    <p>This document describes all environment variables used in this project.</p>
-"""
+    required_rows, optional_rows = _prepare_rows(variables)
 
-    html += "    <h2>Required Variables</h2>\n"
-    html += "    <table>\n"
-    html += "        <tr><th>Variable</th><th>Type</th><th>Description</th><th>Validation</th></tr>\n"
-
-    for var in required_vars:
-        validation = []
-        if var.format:
-            validation.append(f"Format: {var.format}")
-        if var.choices:
-            validation.append(f"Choices: {', '.join(str(c) for c in var.choices)}")
-        validation_str = "; ".join(validation) if validation else "-"
-        desc = var.description or "-"
+    parts = [
+        _HTML_HEADER,
+        "    <h2>Required Variables</h2>\n",
+        "    <table>\n",
+        "        <tr><th>Variable</th><th>Type</th><th>Description</th><th>Validation</th></tr>\n",
+    ]
+    append = parts.append
 
-        html += f"        <tr><td><code>{var.name}</code></td><td>{var.var_type}</td><td>{desc}</td><td>{validation_str}</td></tr>\n"
+    for row in required_rows:
+        append(
+            f"        <tr><td><code>{row.name}</code></td><td>{row.var_type}</td>"
+            f"<td>{row.description}</td><td>{row.validation}</td></tr>\n"
+        )
 
-    html += "    </table>\n"
+    append("    </table>\n")
+    append("    <h2>Optional Variables</h2>\n")
+    append("    <table>\n")
+    append("        <tr><th>Variable</th><th>Type</th><th>Default</th><th>Description</th><th>Validation</th></tr>\n")
 
-    html += "    <h2>Optional Variables</h2>\n"
-    html += "    <table>\n"
-    html += "        <tr><th>Variable</th><th>Type</th><th>Default</th><th>Description</th><th>Validation</th></tr>\n"
+    for row in optional_rows:
+        append(
+            f"        <tr><td><code>{row.name}</code></td><td>{row.var_type}</td><td><code>{row.default}</code></td>"
+            f"<td>{row.description}</td><td>{row.validation}</td></tr>\n"
+        )
 
-    for var in optional_vars:
-        validation = []
-        if var.format:
-            validation.append(f"Format: {var.format}")
-        if var.choices:
-            validation.append(f"Choices: {', '.join(str(c) for c in var.choices)}")
-        validation_str = "; ".join(validation) if validation else "-"
-        desc = var.description or "-"
-        default_str = format_default_value(var.default) or "-"
+    append("    </table>\n")
+    append(_HTML_FOOTER)
 
-        html += f"        <tr><td><code>{var.name}</code></td><td>{var.var_type}</td><td><code>{default_str}</code></td><td>{desc}</td><td>{validation_str}</td></tr>\n"
-
-    html += "    </table>\n"
-    html += """
-    <hr>
-    <p><em>Generated by <a href="https://github.com/Daily-Nerd/TripWire">TripWire</a></em></p>
-</body>
-</html>
-"""
-
-    return html
+    return "".join(parts)
 
 
 def generate_json_docs(variables: dict[str, EnvVarInfo]) -> str:
@@ -195,11 +216,9 @@ def generate_json_docs(variables: dict[str, EnvVarInfo]) -> str:
     Returns:
         JSON formatted documentation
     """
-    from typing import Any
-
     doc: dict[str, Any] = {"variables": []}
 
-    for var in sorted(variables.values(), key=lambda v: v.name):
+    for var in sorted(variables.values(), key=attrgetter("name")):
         var_doc = {
             "name": var.name,
             "type": var.var_type,
@@ -222,7 +241,7 @@ def generate_json_docs(variables: dict[str, EnvVarInfo]) -> str:
 
         doc["variables"].append(var_doc)
 
-    return json.dumps(doc, indent=2)
+    return _JSON_ENCODER.encode(doc)
 
 
 __all__ = ["generate_markdown_docs", "generate_html_docs", "generate_json_docs"]
@@ -75,4 +75,36 @@ DEBUG=false
     },
 }
 
-__all__ = ["PROJECT_TEMPLATES"]
+# Stands in for the generated SECRET_KEY in rendered .env templates
+SECRET_KEY_PLACEHOLDER = "{{RANDOM_KEY}}"
+
+
+def _render_template(template_data: TemplateData, inject_secret: bool) -> str:
+    """Fill a template's {secret_section}.
+
+    Args:
+        template_data: Template definition from PROJECT_TEMPLATES
+        inject_secret: If True, render for .env (SECRET_KEY_PLACEHOLDER is left
+            where the random key goes); if False, render for .env.example
+
+    Returns:
+        Rendered template text
+    """
+    if inject_secret:
+        comment = template_data["secret_comment"]
+        secret_line = f"SECRET_KEY={SECRET_KEY_PLACEHOLDER}" if comment else ""
+    else:
+        comment = template_data["placeholder_comment"]
+        secret_line = "SECRET_KEY=CHANGE_ME_TO_RANDOM_SECRET_KEY" if comment else ""
+    secret_section = f"{comment}\n{secret_line}" if comment else secret_line
+    return template_data["base"].format(secret_section=secret_section)
+
+
+# Templates rendered once at import, keyed by (project_type, inject_secret)
+RENDERED_TEMPLATES: dict[tuple[str, bool], str] = {
+    (project_type, inject_secret): _render_template(template_data, inject_secret)
+    for project_type, template_data in PROJECT_TEMPLATES.items()
+    for inject_secret in (True, False)
+}
+
+__all__ = ["PROJECT_TEMPLATES", "RENDERED_TEMPLATES", "SECRET_KEY_PLACEHOLDER"]
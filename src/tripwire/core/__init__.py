@@ -11,6 +11,8 @@ Version 0.9.0+:
 - TripWireLegacy is available for backward compatibility (deprecated)
 """
 
+from typing import TYPE_CHECKING, Any
+
 # Import components from refactored modules
 from tripwire.core.inference import (
     FrameInspectionStrategy,
@@ -18,14 +20,6 @@ from tripwire.core.inference import (
     TypeInferenceStrategy,
 )
 from tripwire.core.loader import DotenvFileSource, EnvFileLoader, EnvSource
-
-# Plugin system (v0.10.0+)
-from tripwire.core.plugin_system import (
-    PluginLoader,
-    PluginRegistry,
-    PluginSandbox,
-    PluginValidator,
-)
 from tripwire.core.registry import VariableMetadata, VariableRegistry
 
 # Import modern TripWire implementation (v0.9.0+)
@@ -42,6 +36,31 @@ from tripwire.core.validation_orchestrator import (
     ValidationRule,
 )
 
+if TYPE_CHECKING:
+    # Plugin system (v0.10.0+)
+    from tripwire.core.plugin_system import (
+        PluginLoader,
+        PluginRegistry,
+        PluginSandbox,
+        PluginValidator,
+    )
+
+# Plugin system names are resolved lazily: importing plugin_system pulls in the
+# plugin registry (urllib, tarfile, zipfile, ...) which most programs never use.
+_PLUGIN_SYSTEM_NAMES = frozenset({"PluginLoader", "PluginRegistry", "PluginSandbox", "PluginValidator"})
+
+
+def __getattr__(name: str) -> Any:
+    """Lazily import the plugin system on first access (PEP 562)."""
+    if name in _PLUGIN_SYSTEM_NAMES:
+        from tripwire.core import plugin_system
+
+        value = getattr(plugin_system, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 __all__ = [
     # Modern TripWire implementation (v0.9.0+)
     "TripWire",  # Modern implementation (alias for TripWireV2)
@@ -6,6 +6,7 @@ different sources (files, remote configs, etc.) with proper error handling.
 
 from __future__ import annotations
 
+import re
 from abc import ABC, abstractmethod
 from pathlib import Path
 from typing import Dict, List
@@ -14,6 +15,10 @@ from dotenv import load_dotenv as _dotenv_load
 
 from tripwire.exceptions import EnvFileNotFoundError
 
+# KEY=VALUE lines for DotenvFileSource's tracking dict. Blank lines, comments and
+# lines without "=" never match; the key has surrounding whitespace excluded.
+_ASSIGNMENT_RE = re.compile(r"^[^\S\n]*([^#=\s][^=\n]*?)[^\S\n]*=(.*)$", re.MULTILINE)
+
 
 class EnvSource(ABC):
     """Abstract base class for environment variable sources.
@@ -83,22 +88,14 @@ class DotenvFileSource(EnvSource):
         # Load into os.environ
         _dotenv_load(self.file_path, override=self.override)
 
-        # Parse file to return loaded variables for tracking
+        # Parse file to return loaded variables for tracking (one regex scan
+        # over the whole file rather than a Python loop per line)
         loaded_vars: Dict[str, str] = {}
         try:
-            with open(self.file_path, "r", encoding="utf-8") as f:
-                for line in f:
-                    line = line.strip()
-                    # Skip comments and empty lines
-                    if not line or line.startswith("#"):
-                        continue
-                    # Parse KEY=VALUE format
-                    if "=" in line:
-                        key, _, value = line.partition("=")
-                        key = key.strip()
-                        # Remove quotes if present
-                        value = value.strip().strip("\"'")
-                        loaded_vars[key] = value
+            content = self.file_path.read_text(encoding="utf-8")
+            for key, value in _ASSIGNMENT_RE.findall(content):
+                # Remove quotes if present
+                loaded_vars[key] = value.strip().strip("\"'")
         except Exception:
             # If parsing fails, just return empty dict
             # The variables are still loaded into os.environ by dotenv
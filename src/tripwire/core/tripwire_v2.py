@@ -17,7 +17,7 @@ import atexit
 import os
 import threading
 from pathlib import Path
-from typing import Any, List, Optional, Sequence, TypeVar, Union, cast
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, TypeVar, Union, cast
 
 from tripwire.core.inference import FrameInspectionStrategy, TypeInferenceEngine
 from tripwire.core.loader import DotenvFileSource, EnvFileLoader, EnvSource
@@ -106,6 +106,7 @@ class TripWireV2:
         inference_engine: Optional[TypeInferenceEngine] = None,
         sources: Optional[List[EnvSource]] = None,
         collect_errors: bool = True,
+        snapshot_env: bool = False,
     ) -> None:
         """Initialize TripWireV2 with optional component injection.
 
@@ -124,6 +125,10 @@ class TripWireV2:
                      RECOMMENDED for plugin usage - pass plugin instances here
             collect_errors: Whether to collect all validation errors and report together
                            (default: True for better UX, set False for legacy fail-fast behavior)
+            snapshot_env: Whether to copy os.environ once after loading and serve lookups
+                          from that copy (default: False). Later changes to os.environ are
+                          only seen after load(), load_files() or reload(). Repeated
+                          require() calls with identical arguments are then memoized.
 
         Important Usage Patterns:
             Pattern 1 - Direct sources (RECOMMENDED):
@@ -191,6 +196,12 @@ class TripWireV2:
         self._error_lock = threading.Lock()  # Thread-safe error collection
         self._finalized = False  # Track if errors have been finalized
 
+        # Optional plain-dict copy of os.environ (avoids per-lookup encode/decode)
+        self._snapshot_env = snapshot_env
+        self._env_snapshot: Optional[Dict[str, str]] = None
+        # Successful resolutions, memoized while a snapshot is active (cleared by reload())
+        self._resolved: Dict[Tuple[Any, ...], Any] = {}
+
         # Dependency injection with sensible defaults (Factory Pattern)
         self._registry = registry if registry is not None else VariableRegistry()
 
@@ -252,6 +263,8 @@ class TripWireV2:
                 if self.env_file not in self._loaded_files:
                     self._loaded_files.append(self.env_file)
 
+        self.reload()
+
         # Register finalization hook for automatic error reporting
         # This ensures all collected errors are raised when module import completes
         if self.collect_errors:
@@ -332,6 +345,259 @@ class TripWireV2:
         # Step 1: Type Inference (using injected engine)
         inferred_type = self._inference_engine.infer_or_default(explicit_type=type, default=str)
 
+        value = self._require_typed(
+            name,
+            inferred_type,
+            default=default,
+            description=description,
+            format=format,
+            pattern=pattern,
+            choices=choices,
+            min_val=min_val,
+            max_val=max_val,
+            min_length=min_length,
+            max_length=max_length,
+            validator=validator,
+            secret=secret,
+            error_message=error_message,
+        )
+        return cast(T, value)
+
+    def require_many(
+        self,
+        specs: Sequence[Union[str, Tuple[str, Dict[str, Any]], Dict[str, Any]]],
+    ) -> Dict[str, Any]:
+        """Get several environment variables in a single validation pass.
+
+        Each spec is either a dict with a ``name`` key plus any keyword
+        arguments accepted by require(), a ``(name, options)`` tuple, or a
+        bare variable name. All specs are resolved in one loop and every
+        failure is gathered before anything is raised, so a misconfigured
+        deployment reports all of its problems at once.
+
+        Because there is no annotation to inspect, the type of each variable
+        is taken from its ``type`` key, then from the type of its ``default``,
+        and otherwise falls back to str. Skipping frame inspection also makes
+        this cheaper than the equivalent sequence of require() calls.
+
+        Args:
+            specs: Variable specs, e.g. ``{"name": "PORT", "type": int, "min_val": 1}``,
+                ``("API_KEY", {"secret": True})`` or ``"HOSTNAME"``
+
+        Returns:
+            Dictionary mapping each variable name to its validated value
+
+        Raises:
+            ValueError: If a dict spec has no ``name`` key
+            MissingVariableError: If exactly one variable failed because it is not set
+                (fail-fast mode; a single failure is raised as require() would raise it)
+            TypeCoercionError: If exactly one variable failed coercion (fail-fast mode)
+            ValidationError: If exactly one variable failed validation (fail-fast mode)
+            TripWireMultiValidationError: If several variables failed (fail-fast mode)
+
+        Example:
+            >>> config = env.require_many([
+            ...     {"name": "DATABASE_URL", "format": "postgresql"},
+            ...     {"name": "PORT", "type": int, "min_val": 1, "max_val": 65535},
+            ...     {"name": "DEBUG", "default": False},
+            ...     ("API_KEY", {"secret": True}),
+            ... ])
+            >>> config["PORT"]
+            8000
+        """
+        errors: List[ValidationError] = []
+        results: Dict[str, Any] = {}
+        resolved_specs: Dict[str, Tuple[type[Any], Dict[str, Any]]] = {}
+        require_typed = self._require_typed
+
+        for spec in specs:
+            if isinstance(spec, str):
+                name, options = spec, {}
+            elif isinstance(spec, tuple):
+                name, options = spec[0], dict(spec[1])
+            else:
+                options = dict(spec)
+                if "name" not in options:
+                    # Only the keys are shown: a default may be a secret
+                    raise ValueError(f"require_many() dict spec has no 'name' key (keys: {sorted(options)})")
+                name = options.pop("name")
+            type_ = options.pop("type", None)
+            if type_ is None:
+                default = options.get("default")
+                type_ = default.__class__ if default is not None else str
+            resolved_specs[name] = (type_, options)
+            results[name] = require_typed(name, type_, error_sink=errors, **options)
+
+        if errors:
+            if self.collect_errors:
+                # Reported together with everything else at finalization
+                self._collect_errors(errors, None)
+            elif len(errors) == 1:
+                # Resolve the failing variable again without the sink so it raises the same
+                # exception type require() would (MissingVariableError, TypeCoercionError, ...)
+                type_, options = resolved_specs[errors[0].variable_name]
+                require_typed(errors[0].variable_name, type_, **options)
+                raise errors[0]  # The environment changed in between; report what was seen
+            else:
+                raise TripWireMultiValidationError(errors)
+
+        return results
+
+    def bind(
+        self,
+        name: str,
+        *,
+        type: type[Any] = str,  # noqa: A002
+        secret: bool = False,
+        description: Optional[str] = None,
+    ) -> Callable[[], Any]:
+        """Return a zero-argument getter for one variable.
+
+        The variable is resolved once when bound, exactly like require() with
+        the same type, so it is registered only after it has been checked (and
+        a missing or malformed value fails at startup). The getter then reads
+        the current value on every call (honouring snapshot_env and reload())
+        but skips type inference, registration and the validation pipeline,
+        which makes it suited to hot paths such as per-request dependencies.
+
+        Args:
+            name: Environment variable name
+            type: Type to coerce to (default: str)
+            secret: Wrap the value in Secret[T] and register it for log redaction
+            description: Human-readable description for documentation
+
+        Returns:
+            Callable returning the coerced (and possibly wrapped) value
+
+        Raises:
+            MissingVariableError: If the variable is not set (at bind time in
+                fail-fast mode, or later when the getter is called)
+            TypeCoercionError: If coercion fails (at bind time in fail-fast mode,
+                or later when the getter is called)
+
+        Example:
+            >>> get_token = env.bind("GITHUB_TOKEN", secret=True)
+            >>> get_token()
+            Secret('**********')
+        """
+        # Validate (and register) once up front; in collect mode errors are reported at finalization
+        self._require_typed(name, type, description=description, secret=secret)
+
+        getenv = self._getenv
+        target_type = type
+
+        if not secret:
+
+            def get() -> Any:
+                raw_value = getenv(name)
+                if raw_value is None:
+                    raise MissingVariableError(name, description)
+                if target_type is str:
+                    return raw_value
+                return coerce_type(raw_value, target_type, name)
+
+            return get
+
+        from tripwire.security.logging import register_secret
+
+        # Only the most recent value is remembered, so rotations don't accumulate plaintext here
+        last_registered: Optional[str] = None
+
+        def get_secret() -> Any:
+            nonlocal last_registered
+            raw_value = getenv(name)
+            if raw_value is None:
+                raise MissingVariableError(name, description)
+            value = raw_value if target_type is str else coerce_type(raw_value, target_type, name)
+            text = str(value)
+            if text != last_registered:
+                register_secret(text)  # Register for logging redaction when the value changes
+                last_registered = text
+            return Secret(value)
+
+        return get_secret
+
+    def _require_typed(
+        self,
+        name: str,
+        inferred_type: type[Any],
+        *,
+        error_sink: Optional[List[ValidationError]] = None,
+        **options: Any,
+    ) -> Any:
+        """Retrieve, coerce and validate a variable whose type is already known.
+
+        This is the body of require() after type inference, shared with
+        require_many() and bind().
+
+        Args:
+            name: Environment variable name
+            inferred_type: Type to coerce to
+            error_sink: If given, errors are appended here instead of being
+                collected on the instance or raised
+            **options: Keyword options of require() (default, format, choices,
+                ...), passed through to _resolve(), which defines them
+
+        Returns:
+            Validated and type-coerced value (or a placeholder if an error
+            was collected)
+
+        Note:
+            With snapshot_env=True the environment can only change through
+            reload(), so successful resolutions are memoized on the name, type
+            and every option passed. Calls with unhashable options (e.g. a list
+            default) are never memoized, and neither are calls that reported errors.
+        """
+        if self._env_snapshot is None:
+            return self._resolve(name, inferred_type, error_sink=error_sink, **options)
+
+        key = (
+            name,
+            inferred_type,
+            options.get("default").__class__,  # keeps default=False and default=0 apart
+            # Option names are unique, so sorting never compares the values themselves;
+            # a choices list is keyed by its contents
+            *sorted(
+                (option, tuple(value) if option == "choices" and value is not None else value)
+                for option, value in options.items()
+            ),
+        )
+        try:
+            return self._resolved[key]
+        except KeyError:
+            cacheable = True
+        except TypeError:
+            cacheable = False  # Unhashable option - resolve without memoizing
+
+        errors = error_sink if error_sink is not None else self._validation_errors
+        error_count = len(errors)
+        value = self._resolve(name, inferred_type, error_sink=error_sink, **options)
+        if cacheable and len(errors) == error_count:
+            self._resolved[key] = value
+        return value
+
+    def _resolve(
+        self,
+        name: str,
+        inferred_type: type[Any],
+        *,
+        default: Any = None,
+        description: Optional[str] = None,
+        format: Optional[str] = None,  # noqa: A002
+        pattern: Optional[str] = None,
+        choices: Optional[List[str]] = None,
+        min_val: Optional[Union[int, float]] = None,
+        max_val: Optional[Union[int, float]] = None,
+        min_length: Optional[int] = None,
+        max_length: Optional[int] = None,
+        validator: Optional[ValidatorFunc] = None,
+        secret: bool = False,
+        error_message: Optional[str] = None,
+        error_sink: Optional[List[ValidationError]] = None,
+    ) -> Any:
+        """Uncached body of _require_typed()."""
+        collecting = error_sink is not None or self.collect_errors
+
         # Step 2: Register variable for documentation generation
         self._register_variable(
             name=name,
@@ -343,45 +609,44 @@ class TripWireV2:
         )
 
         # Step 3: Retrieve and coerce value
-        raw_value = os.getenv(name)
+        raw_value = self._getenv(name)
         if raw_value is None:
             if default is not None:
                 return default
 
             # Handle missing variable based on error collection mode
-            if self.collect_errors:
+            if collecting:
                 # Collect error and return placeholder (will be caught at finalization)
                 error = ValidationError(
                     variable_name=name,
                     value=None,
                     reason="Required but not set",
                 )
-                with self._error_lock:
-                    self._validation_errors.append(error)
+                self._collect_errors([error], error_sink)
                 # Return type-appropriate placeholder (will fail at finalization anyway)
-                return self._get_placeholder_value(inferred_type)  # type: ignore
+                return self._get_placeholder_value(inferred_type)
             else:
                 # Fail-fast mode
                 raise MissingVariableError(name, description)
 
         # Type coercion with error collection
+        coerced_value: Any
         try:
             if inferred_type is not str:
                 coerced_value = coerce_type(raw_value, inferred_type, name)
             else:
-                coerced_value = raw_value  # type: ignore[assignment]
+                coerced_value = raw_value
         except Exception as e:
             # Type coercion failed
-            if self.collect_errors:
+            if collecting:
                 # Convert to ValidationError and collect
                 error = ValidationError(
                     variable_name=name,
                     value=raw_value,
                     reason=f"Cannot coerce to {inferred_type.__name__}: {e}",
                 )
-                with self._error_lock:
-                    self._validation_errors.append(error)
-                return self._get_placeholder_value(inferred_type)  # type: ignore
+                self._collect_errors([error], error_sink)
+                return self._get_placeholder_value(inferred_type)
             else:
                 # Fail-fast mode
                 raise
@@ -407,15 +672,14 @@ class TripWireV2:
             expected_type=inferred_type,
         )
 
-        if self.collect_errors:
+        if collecting:
             # Enable error collection in orchestrator
             orchestrator.collect_errors = True
             orchestrator.validate(context)
 
             # Collect any errors from orchestrator
             if orchestrator.has_errors():
-                with self._error_lock:
-                    self._validation_errors.extend(orchestrator.get_collected_errors())
+                self._collect_errors(orchestrator.get_collected_errors(), error_sink)
         else:
             # Fail-fast mode (legacy behavior)
             orchestrator.validate(context)
@@ -433,9 +697,9 @@ class TripWireV2:
 
             # Wrap the coerced value in Secret wrapper
             # This prevents accidental exposure through print(), logging, JSON, etc.
-            return cast(T, Secret(coerced_value))
+            return Secret(coerced_value)
 
-        return cast(T, coerced_value)
+        return coerced_value
 
     def optional(
         self,
@@ -519,6 +783,8 @@ class TripWireV2:
         if file_path not in self._loaded_files:
             self._loaded_files.append(file_path)
 
+        self.reload()
+
     def load_files(self, file_paths: List[Union[str, Path]], override: bool = False) -> None:
         """Load multiple .env files in order.
 
@@ -536,6 +802,33 @@ class TripWireV2:
         temp_loader = EnvFileLoader(sources, strict=self.strict)
         temp_loader.load_all()
 
+        self.reload()
+
+    def reload(self) -> None:
+        """Refresh the environment snapshot from os.environ.
+
+        Call this after changing os.environ directly. Has no effect unless the
+        instance was created with snapshot_env=True, since other instances
+        always read os.environ live.
+
+        Example:
+            >>> env = TripWireV2(snapshot_env=True)
+            >>> os.environ["FEATURE_FLAG"] = "on"
+            >>> env.reload()
+            >>> env.has("FEATURE_FLAG")
+            True
+        """
+        if self._snapshot_env:
+            self._env_snapshot = dict(os.environ)
+            self._resolved.clear()
+
+    def _getenv(self, name: str) -> Optional[str]:
+        """Look up a raw value from the snapshot, or os.environ if there is none."""
+        snapshot = self._env_snapshot
+        if snapshot is None:
+            return os.getenv(name)
+        return snapshot.get(name)
+
     def get_registry(self) -> dict[str, dict[str, Any]]:
         """Get the registry of all registered variables.
 
@@ -585,7 +878,7 @@ class TripWireV2:
             >>> api_key = env.get("API_KEY")
             >>> port = env.get("PORT", default=8000, type=int)
         """
-        raw_value = os.getenv(name)
+        raw_value = self._getenv(name)
         if raw_value is None:
             return default
 
@@ -607,7 +900,8 @@ class TripWireV2:
             >>> if env.has("DEBUG"):
             ...     print("Debug mode enabled")
         """
-        return name in os.environ
+        snapshot = self._env_snapshot
+        return name in (os.environ if snapshot is None else snapshot)
 
     def all(self) -> dict[str, str]:
         """Get all environment variables.
@@ -619,7 +913,7 @@ class TripWireV2:
             >>> all_vars = env.all()
             >>> print(all_vars.keys())
         """
-        return dict(os.environ)
+        return dict(os.environ if self._env_snapshot is None else self._env_snapshot)
 
     # --- Typed Convenience Methods (Backward Compatibility) ---
 
@@ -964,6 +1258,24 @@ class TripWireV2:
 
     # --- Private Helper Methods ---
 
+    def _collect_errors(
+        self,
+        errors: List[ValidationError],
+        error_sink: Optional[List[ValidationError]],
+    ) -> None:
+        """Record validation errors for later reporting.
+
+        Args:
+            errors: Errors to record
+            error_sink: Caller-owned list to append to; when None, errors are
+                stored on the instance for finalization
+        """
+        if error_sink is not None:
+            error_sink.extend(errors)
+            return
+        with self._error_lock:
+            self._validation_errors.extend(errors)
+
     def _register_variable(
         self,
         name: str,
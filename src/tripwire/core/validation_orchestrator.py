@@ -89,17 +89,16 @@ class FormatValidationRule(ValidationRule):
     def validate(self, context: ValidationContext) -> None:
         """Validate value matches format."""
         from tripwire.exceptions import ValidationError
-        from tripwire.validation import get_validator
+        from tripwire.validation import get_validator, validate_format
 
-        validator = get_validator(self.format_name)
-        if validator is None:
+        if get_validator(self.format_name) is None:
             raise ValidationError(
                 variable_name=context.name,
                 value=context.raw_value,
                 reason=f"Unknown format validator '{self.format_name}'",
             )
 
-        if not validator(context.raw_value):
+        if not validate_format(context.raw_value, self.format_name):
             reason = self.error_message if self.error_message else f"Invalid format: expected {self.format_name}"
             raise ValidationError(variable_name=context.name, value=context.raw_value, reason=reason)
 
@@ -139,13 +138,14 @@ class ChoicesValidationRule(ValidationRule):
         """
         super().__init__(error_message)
         self.choices = choices
+        # Built once per rule so each check is a hash lookup instead of a list scan
+        self._choice_set = frozenset(choices)
 
     def validate(self, context: ValidationContext) -> None:
         """Validate value is in allowed choices."""
         from tripwire.exceptions import ValidationError
-        from tripwire.validation import validate_choices
 
-        if not validate_choices(context.raw_value, self.choices):
+        if context.raw_value not in self._choice_set:
             reason = self.error_message if self.error_message else f"Not in allowed choices: {self.choices}"
             raise ValidationError(variable_name=context.name, value=context.raw_value, reason=reason)
 
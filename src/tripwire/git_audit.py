@@ -4,16 +4,22 @@ This module provides functionality to analyze git history and detect when secret
 were leaked, providing detailed timeline information and remediation steps.
 """
 
+import functools
+import os
+import queue
 import re
 import shlex
 import shutil
 import subprocess
 import sys
+import threading
 import warnings
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Iterator, List, Optional, Set, Tuple
+from typing import Callable, Dict, Generator, Iterator, List, Optional, Set, Tuple, Union
 
 from tripwire.exceptions import GitCommandError, NotGitRepositoryError
 
@@ -38,6 +44,13 @@ _DEFAULT_MAX_MEMORY_MB: int = 100
 # Process commits in chunks to prevent unbounded memory growth
 _DEFAULT_CHUNK_SIZE: int = 100
 
+# Concurrent git searches per chunk; more than this stops paying off past physical cores
+_DEFAULT_NUM_WORKERS: int = min(os.cpu_count() or 1, 16)
+
+# Occurrences each parallel worker may buffer before waiting for the consumer,
+# so in-flight results stay bounded by num_workers * this, not by a whole chunk
+_WORKER_QUEUE_SIZE: int = 64
+
 # Memory Protection: Estimated bytes per FileOccurrence object WITH __slots__
 # Reduced from 512 to ~300 bytes due to __slots__ optimization (40% reduction)
 # Based on: strings (file_path ~50, author ~30, email ~30, message ~100, context ~100)
@@ -114,6 +127,12 @@ def sanitize_git_pattern(pattern: str, max_length: int = _MAX_PATTERN_LENGTH) ->
     return pattern
 
 
+@functools.lru_cache(maxsize=128)
+def _compile_secret_pattern(secret_pattern: str) -> "re.Pattern[str]":
+    """Compile a secret search pattern (case-insensitive), reusing earlier compilations."""
+    return re.compile(secret_pattern, re.IGNORECASE)
+
+
 def _intern_string(value: str, cache: Dict[str, str]) -> str:
     """Intern a string to reduce memory usage for duplicate values.
 
@@ -296,6 +315,92 @@ def run_git_command(
         raise GitCommandError(command="git", stderr=str(e), returncode=127) from e
 
 
+class GitCatFile:
+    """Long-running ``git cat-file --batch`` process for reading many blobs.
+
+    Reading each file with ``git show <commit>:<path>`` forks a new git process per
+    file per commit. This keeps one process open and requests objects over its
+    stdin/stdout instead, so a history scan costs one fork rather than one per blob.
+
+    Use as a context manager so the process is always shut down::
+
+        with GitCatFile(repo_path) as cat_file:
+            content = cat_file.read_text(f"{commit_hash}:{file_path}")
+    """
+
+    def __init__(self, repo_path: Path) -> None:
+        try:
+            self._proc = subprocess.Popen(
+                ["git", "cat-file", "--batch"],
+                cwd=repo_path,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+            )
+        except FileNotFoundError as e:
+            raise GitCommandError(command="git cat-file --batch", stderr=str(e), returncode=127) from e
+
+    def read_blob(self, object_spec: str) -> Optional[bytes]:
+        """Read a blob by object name (e.g. ``"<commit>:<path>"``).
+
+        Returns:
+            Raw blob content, or None if the object is missing or not a blob
+        """
+        # The batch protocol is line-based; a newline would be read as a second request
+        if "\n" in object_spec:
+            return None
+
+        stdin = self._proc.stdin
+        stdout = self._proc.stdout
+        assert stdin is not None and stdout is not None
+
+        try:
+            stdin.write(object_spec.encode("utf-8") + b"\n")
+            stdin.flush()
+        except (BrokenPipeError, OSError):
+            return None
+
+        # "<sha> <type> <size>\n" followed by the content and a LF,
+        # or "<spec> missing\n" / "<spec> ambiguous\n" with no content
+        header = stdout.readline().split()
+        if len(header) != 3 or not header[2].isdigit():
+            return None
+
+        content = stdout.read(int(header[2]))
+        stdout.read(1)  # Trailing LF after the content
+
+        return content if header[1] == b"blob" else None
+
+    def read_text(self, object_spec: str) -> Optional[str]:
+        """Read a blob and decode it like ``git show`` output in text mode.
+
+        Invalid UTF-8 is replaced rather than raised, and CRLF/CR line endings
+        are normalized to LF.
+        """
+        content = self.read_blob(object_spec)
+        if content is None:
+            return None
+        return content.decode("utf-8", errors="replace").replace("\r\n", "\n").replace("\r", "\n")
+
+    def close(self) -> None:
+        """Close stdin so git exits, and reap the process."""
+        if self._proc.stdin:
+            self._proc.stdin.close()
+        try:
+            self._proc.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            self._proc.kill()
+            self._proc.wait()
+        if self._proc.stdout:
+            self._proc.stdout.close()
+
+    def __enter__(self) -> "GitCatFile":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+
 def check_git_repository(repo_path: Path) -> None:
     """Check if directory is a git repository.
 
@@ -433,8 +538,9 @@ def get_commit_info(commit_hash: str, repo_path: Path) -> Optional[Dict[str, str
 
 def find_secret_in_commit(
     commit_hash: str,
-    secret_pattern: str,
+    secret_pattern: Union[str, "re.Pattern[str]"],
     repo_path: Path,
+    cat_file: Optional[GitCatFile] = None,
 ) -> List[FileOccurrence]:
     """Find all occurrences of a secret pattern in a specific commit.
 
@@ -444,8 +550,11 @@ def find_secret_in_commit(
 
     Args:
         commit_hash: Git commit hash to search
-        secret_pattern: Regex pattern to search for
+        secret_pattern: Regex pattern to search for, or one already compiled by the
+            caller (matched case-insensitively when given as a string)
         repo_path: Path to git repository
+        cat_file: Open GitCatFile to read file contents through. Callers scanning
+            many commits should pass one; if omitted, one is opened for this call.
 
     Returns:
         List of file occurrences found in the commit
@@ -475,7 +584,29 @@ def find_secret_in_commit(
     files = result.stdout.strip().split("\n")
 
     # Search each file for the pattern
-    pattern = re.compile(secret_pattern, re.IGNORECASE)
+    pattern = secret_pattern if isinstance(secret_pattern, re.Pattern) else _compile_secret_pattern(secret_pattern)
+
+    if cat_file is None:
+        with GitCatFile(repo_path) as owned_cat_file:
+            return _search_commit_files(
+                commit_hash, files, pattern, commit_info, interned_author, interned_email, owned_cat_file
+            )
+
+    return _search_commit_files(commit_hash, files, pattern, commit_info, interned_author, interned_email, cat_file)
+
+
+def _search_commit_files(
+    commit_hash: str,
+    files: List[str],
+    pattern: "re.Pattern[str]",
+    commit_info: Dict[str, str],
+    author: str,
+    author_email: str,
+    cat_file: GitCatFile,
+) -> List[FileOccurrence]:
+    """Search the given files of one commit for pattern, reading blobs via cat_file."""
+    occurrences: List[FileOccurrence] = []
+    search = pattern.search
 
     for file_path in files:
         if not file_path:
@@ -499,19 +630,14 @@ def find_secret_in_commit(
             continue
 
         # Get file content from commit
-        file_result = run_git_command(
-            ["show", f"{commit_hash}:{file_path}"],
-            repo_path,
-            check=False,
-        )
-
-        if file_result.returncode != 0:
+        content = cat_file.read_text(f"{commit_hash}:{file_path}")
+        if content is None:
             continue
 
         # Search for pattern in file content
-        lines = file_result.stdout.split("\n")
+        lines = content.split("\n")
         for line_num, line in enumerate(lines, 1):
-            if pattern.search(line):
+            if search(line):
                 # Redact the actual secret value for context
                 redacted_line = pattern.sub("***REDACTED***", line)
 
@@ -522,8 +648,8 @@ def find_secret_in_commit(
                         line_number=line_num,
                         commit_hash=commit_hash,
                         commit_date=datetime.fromisoformat(commit_info["date"]),
-                        author=interned_author,  # Interned string (shared reference)
-                        author_email=interned_email,  # Interned string (shared reference)
+                        author=author,  # Interned string (shared reference)
+                        author_email=author_email,  # Interned string (shared reference)
                         commit_message=commit_info["message"],
                         context=redacted_line.strip()[:100],
                     )
@@ -532,6 +658,185 @@ def find_secret_in_commit(
     return occurrences
 
 
+def _search_commits_individually(
+    commit_hashes: List[str],
+    secret_pattern: str,
+    repo_path: Path,
+) -> Generator[FileOccurrence, None, None]:
+    """Search commits one at a time with find_secret_in_commit, sharing one GitCatFile."""
+    pattern = _compile_secret_pattern(secret_pattern)
+    with GitCatFile(repo_path) as cat_file:
+        for commit_hash in commit_hashes:
+            yield from find_secret_in_commit(commit_hash, pattern, repo_path, cat_file)
+
+
+def _git_grep_accepts(secret_pattern: str, repo_path: Path) -> bool:
+    """Check whether ``git grep -P`` can compile the pattern.
+
+    Fails when git was built without PCRE or the pattern isn't valid PCRE. The
+    pathspec matches nothing, so this only costs the pattern compilation.
+    """
+    try:
+        result = run_git_command(
+            ["grep", "-q", "-i", "-P", "-e", secret_pattern, "--", ":(literal)tripwire-no-such-path"],
+            repo_path,
+            check=False,
+        )
+    except GitCommandError:
+        return False
+    return result.returncode in (0, 1)
+
+
+def _grep_commits(
+    commit_hashes: List[str],
+    secret_pattern: str,
+    repo_path: Path,
+) -> Generator[FileOccurrence, None, None]:
+    """Search several commits with a single ``git grep`` process.
+
+    git runs the regex against its object store directly and skips binary files
+    (``-I``), so no blob is copied into Python unless it has a matching line.
+    PCRE is used because the patterns are written for Python's ``re`` (``\\s``
+    inside a character class is literal in POSIX regex). Each reported line is
+    re-checked with ``re`` before redaction, so context is never stored unredacted.
+
+    Args:
+        commit_hashes: Commits (or other revisions) to search
+        secret_pattern: Regex pattern accepted by ``_git_grep_accepts``
+        repo_path: Path to git repository
+
+    Yields:
+        FileOccurrence for each matching line, grouped by commit in the given order
+    """
+    pattern = _compile_secret_pattern(secret_pattern)
+    commit_details: Dict[str, Optional[Tuple[Dict[str, str], str, str]]] = {}
+
+    proc = subprocess.Popen(
+        ["git", "grep", "-n", "-z", "-I", "-i", "-P", "--no-color", "-e", secret_pattern, *commit_hashes],
+        cwd=repo_path,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+    )
+
+    try:
+        # With -z each match is "<rev>:<path>\0<line number>\0<line>\n"
+        for raw_line in proc.stdout:  # type: ignore[union-attr]
+            location, _, rest = raw_line.rstrip(b"\n").partition(b"\0")
+            line_number, sep, content = rest.partition(b"\0")
+            if not sep:
+                continue
+
+            line = content.decode("utf-8", errors="replace")
+            if not pattern.search(line):
+                continue
+
+            commit_hash, _, file_path = location.decode("utf-8", errors="replace").partition(":")
+
+            if commit_hash not in commit_details:
+                commit_info = get_commit_info(commit_hash, repo_path)
+                commit_details[commit_hash] = (
+                    (
+                        commit_info,
+                        _intern_string(commit_info["author"], _AUTHOR_CACHE),
+                        _intern_string(commit_info["email"], _EMAIL_CACHE),
+                    )
+                    if commit_info
+                    else None
+                )
+            details = commit_details[commit_hash]
+            if details is None:
+                continue
+            commit_info, author, author_email = details
+
+            yield FileOccurrence(
+                file_path=file_path,
+                line_number=int(line_number),
+                commit_hash=commit_hash,
+                commit_date=datetime.fromisoformat(commit_info["date"]),
+                author=author,
+                author_email=author_email,
+                commit_message=commit_info["message"],
+                context=pattern.sub("***REDACTED***", line).strip()[:100],
+            )
+    finally:
+        # Iteration may stop early (HEAD check, memory limit)
+        if proc.poll() is None:
+            proc.kill()
+        proc.wait()
+        if proc.stdout:
+            proc.stdout.close()
+
+
+# What a parallel search worker hands back: an occurrence, the exception it raised, or None when done
+_WorkerItem = Union[FileOccurrence, Exception, None]
+
+
+def _search_commits_parallel(
+    search_commits: Callable[[List[str], str, Path], Generator[FileOccurrence, None, None]],
+    commit_hashes: List[str],
+    secret_pattern: str,
+    repo_path: Path,
+    num_workers: int,
+) -> Generator[FileOccurrence, None, None]:
+    """Split commit_hashes into one batch per worker and search the batches concurrently.
+
+    The searching happens in git subprocesses, so threads overlap them without
+    contending for the GIL. Results are yielded in commit order, as the sequential
+    search would produce them.
+
+    Each worker streams into its own bounded queue, so the caller's memory checks
+    still see occurrences as they are found. Closing the generator early (e.g. on
+    the memory limit) signals the workers to stop and shut down their git processes.
+    """
+    if num_workers <= 1 or len(commit_hashes) <= 1:
+        yield from search_commits(commit_hashes, secret_pattern, repo_path)
+        return
+
+    batch_size = -(-len(commit_hashes) // num_workers)  # Ceiling division
+    batches = [commit_hashes[i : i + batch_size] for i in range(0, len(commit_hashes), batch_size)]
+    # Each queue carries a batch's occurrences, then None when done (or the exception it raised)
+    result_queues: List["queue.Queue[_WorkerItem]"] = [queue.Queue(maxsize=_WORKER_QUEUE_SIZE) for _ in batches]
+    stop = threading.Event()
+
+    def put(results: "queue.Queue[_WorkerItem]", item: _WorkerItem) -> bool:
+        # Block while the queue is full, but give up once the consumer has stopped
+        while not stop.is_set():
+            try:
+                results.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def search_batch(batch: List[str], results: "queue.Queue[_WorkerItem]") -> None:
+        try:
+            with closing(search_commits(batch, secret_pattern, repo_path)) as occurrences:
+                for occurrence in occurrences:
+                    if not put(results, occurrence):
+                        return
+        except Exception as e:
+            put(results, e)
+            return
+        put(results, None)
+
+    executor = ThreadPoolExecutor(max_workers=len(batches))
+    try:
+        for batch, results in zip(batches, result_queues, strict=True):
+            executor.submit(search_batch, batch, results)
+
+        for results in result_queues:
+            while True:
+                item = results.get()
+                if item is None:
+                    break
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+    finally:
+        stop.set()
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
 def get_affected_branches(commit_hash: str, repo_path: Path) -> List[str]:
     """Get list of branches that contain a specific commit.
 
@@ -619,19 +924,21 @@ def audit_secret_stream(
 
     try:
         count = 0
-        for line in proc.stdout:  # type: ignore[union-attr]
-            if count >= max_commits:
-                break
+        pattern = _compile_secret_pattern(sanitized_pattern)
+        with GitCatFile(repo_path) as cat_file:
+            for line in proc.stdout:  # type: ignore[union-attr]
+                if count >= max_commits:
+                    break
 
-            commit_hash = line.strip()
-            if not commit_hash:
-                continue
+                commit_hash = line.strip()
+                if not commit_hash:
+                    continue
 
-            # Stream occurrences from this commit
-            for occurrence in find_secret_in_commit(commit_hash, sanitized_pattern, repo_path):
-                yield occurrence
+                # Stream occurrences from this commit
+                for occurrence in find_secret_in_commit(commit_hash, pattern, repo_path, cat_file):
+                    yield occurrence
 
-            count += 1
+                count += 1
 
     finally:
         # CRITICAL: Terminate process if iteration stopped early
@@ -660,6 +967,7 @@ def analyze_secret_history(
     max_commits: int = 100,  # Reduced from 1000 to 100 for better performance
     max_memory_mb: int = _DEFAULT_MAX_MEMORY_MB,
     chunk_size: int = _DEFAULT_CHUNK_SIZE,
+    num_workers: int = _DEFAULT_NUM_WORKERS,
 ) -> SecretTimeline:
     """Analyze git history to find when and where a secret was leaked.
 
@@ -686,6 +994,8 @@ def analyze_secret_history(
         max_commits: Maximum number of commits to analyze
         max_memory_mb: Maximum memory to use in MB (default: 100MB). Prevents OOM crashes.
         chunk_size: Number of commits to process per chunk (default: 100)
+        num_workers: Number of git searches to run concurrently within a chunk
+            (default: CPU count, capped at 16). Use 1 to search sequentially.
 
     Returns:
         SecretTimeline with all occurrences and metadata
@@ -763,17 +1073,22 @@ def analyze_secret_history(
     max_memory_bytes: int = max_memory_mb * 1024 * 1024  # Convert MB to bytes
     memory_limit_reached: bool = False
 
+    # Let git grep scan each chunk in one process when it understands the pattern,
+    # otherwise read the files of each commit through cat-file
+    search_commits = _grep_commits if _git_grep_accepts(sanitized_pattern, repo_path) else _search_commits_individually
+
     # CRITICAL FIX: Chunked processing to prevent unbounded memory growth
     # Process commits in chunks instead of all at once
     total_commits = len(commit_hashes)
     for chunk_start in range(0, total_commits, chunk_size):
         chunk_end = min(chunk_start + chunk_size, total_commits)
         chunk = commit_hashes[chunk_start:chunk_end]
+        commit_indexes = {commit_hash: index for index, commit_hash in enumerate(chunk, start=chunk_start)}
 
         # Process each commit in this chunk
-        for commit_index, commit_hash in enumerate(chunk, start=chunk_start):
-            occurrences = find_secret_in_commit(commit_hash, sanitized_pattern, repo_path)
-
+        with closing(
+            _search_commits_parallel(search_commits, chunk, sanitized_pattern, repo_path, num_workers)
+        ) as occurrences:
             for occ in occurrences:
                 key = (occ.commit_hash, occ.file_path, occ.line_number)
                 if key not in seen_occurrences:
@@ -790,7 +1105,7 @@ def analyze_secret_history(
                             f"Memory limit of {max_memory_mb}MB reached while analyzing git history. "
                             f"Returning partial results ({len(all_occurrences)} occurrences from "
                             f"{len(seen_occurrences)} unique locations). "
-                            f"Processed {commit_index + 1} of {total_commits} commits. "
+                            f"Processed {commit_indexes[occ.commit_hash] + 1} of {total_commits} commits. "
                             f"For large repositories, use audit_secret_stream() instead to avoid memory limits.",
                             RuntimeWarning,
                             stacklevel=2,
@@ -802,10 +1117,6 @@ def analyze_secret_history(
                     all_occurrences.append(occ)
                     estimated_memory_bytes += occurrence_size
 
-            # Exit commit loop if memory limit reached
-            if memory_limit_reached:
-                break
-
         # Exit chunk loop if memory limit reached
         if memory_limit_reached:
             break
@@ -819,8 +1130,8 @@ def analyze_secret_history(
         # Security: Validate HEAD is a valid git ref before use
         result = run_git_command(["rev-parse", "--verify", "HEAD"], repo_path, check=False)
         if result.returncode == 0:
-            head_occurrences = find_secret_in_commit("HEAD", sanitized_pattern, repo_path)
-            is_currently_in_git = len(head_occurrences) > 0
+            with closing(search_commits(["HEAD"], sanitized_pattern, repo_path)) as head_occurrences:
+                is_currently_in_git = next(head_occurrences, None) is not None
         else:
             # HEAD is invalid or repo is in bad state
             is_currently_in_git = False
@@ -8,7 +8,7 @@ import os
 import re
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Mapping, Optional, Tuple
 
 
 @dataclass
@@ -337,6 +337,24 @@ def compare_env_files(env_file: Path, example_file: Path) -> Tuple[List[str], Li
     env_vars = parse_env_file(env_file) if env_file.exists() else {}
     example_vars = parse_env_file(example_file)
 
+    return compare_env_vars(env_vars, example_vars)
+
+
+def compare_env_vars(
+    env_vars: Mapping[str, str], example_vars: Mapping[str, str]
+) -> Tuple[List[str], List[str], List[str]]:
+    """Compare already-parsed .env variables against .env.example variables.
+
+    Same result as compare_env_files(), for callers that need the parsed
+    values afterwards and don't want to read either file twice.
+
+    Args:
+        env_vars: Variables parsed from the .env file
+        example_vars: Variables parsed from the .env.example file
+
+    Returns:
+        Tuple of (missing_vars, extra_vars, common_vars)
+    """
     env_keys = set(env_vars.keys())
     example_keys = set(example_vars.keys())
 
@@ -427,6 +445,29 @@ def merge_env_files(
     else:
         entries = {}
 
+    return merge_env_entries(entries, new_vars, preserve_existing, preserve_comments)
+
+
+def merge_env_entries(
+    entries: Dict[str, EnvEntry],
+    new_vars: Dict[str, str],
+    preserve_existing: bool = True,
+    include_comments: bool = True,
+) -> str:
+    """Merge new variables into already-parsed .env entries.
+
+    Same result as merge_env_files(), for callers that have already parsed
+    the base file. ``entries`` is updated in place.
+
+    Args:
+        entries: Parsed entries of the existing .env file
+        new_vars: Dictionary of new variables to add
+        preserve_existing: Whether to preserve existing values
+        include_comments: Whether to include comments in the output
+
+    Returns:
+        Merged .env file content
+    """
     # Add or update variables
     max_line = max((e.line_number for e in entries.values()), default=0)
 
@@ -444,4 +485,4 @@ def merge_env_files(
             entries[key] = EnvEntry(key=key, value=value, comment=None, line_number=max_line)
 
     # Format and return
-    return format_env_file(entries, include_comments=preserve_comments)
+    return format_env_file(entries, include_comments=include_comments)
@@ -22,7 +22,6 @@ import tarfile
 import tempfile
 import urllib.error
 import urllib.parse
-import urllib.request
 import zipfile
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
@@ -374,6 +373,9 @@ class PluginRegistryClient:
             # Validate URL scheme for security (prevent SSRF)
             _validate_url_scheme(self.registry_url)
 
+            # Deferred: urllib.request pulls in http.client/ssl, which only network paths need
+            import urllib.request
+
             with urllib.request.urlopen(
                 self.registry_url, timeout=10
             ) as response:  # nosec B310  # URL scheme validated above
@@ -744,6 +746,8 @@ class PluginInstaller:
         temp_dir = Path(tempfile.gettempdir())
         archive_path = temp_dir / f"tripwire-plugin-{version_info.version}.tar.gz"
 
+        import urllib.request
+
         try:
             with urllib.request.urlopen(
                 version_info.download_url, timeout=30
@@ -32,6 +32,7 @@ Environment Variables (Alternative to constructor args):
 
 from __future__ import annotations
 
+import asyncio
 import os
 import warnings
 from typing import Any
@@ -166,6 +167,9 @@ class VaultEnvSource(PluginInterface):
         # Lazy-load hvac client
         self._client: Any | None = None
 
+        # Secrets from the last successful read (see refresh())
+        self._cache: dict[str, str] | None = None
+
     @property
     def client(self) -> Any:
         """Get or create Vault client.
@@ -199,7 +203,9 @@ class VaultEnvSource(PluginInterface):
         """Load secrets from Vault KV store.
 
         Reads all key-value pairs from the specified Vault path and returns
-        them as environment variables.
+        them as environment variables. The whole path is fetched in a single
+        request and kept in memory, so later calls don't hit Vault again;
+        use refresh() to re-read it (e.g. after rotating secrets).
 
         Returns:
             Dictionary of environment variable name -> value mappings
@@ -213,6 +219,9 @@ class VaultEnvSource(PluginInterface):
             >>> print(secrets)
             {'DATABASE_URL': 'postgresql://...', 'API_KEY': 'sk_...'}
         """
+        if self._cache is not None:
+            return dict(self._cache)
+
         try:
             # Verify authentication
             if not self.client.is_authenticated():
@@ -248,7 +257,8 @@ class VaultEnvSource(PluginInterface):
                     # Skip complex types (lists, dicts) as they can't be env vars
                     continue
 
-            return env_vars
+            self._cache = env_vars
+            return dict(env_vars)
 
         except Exception as e:
             # Wrap any exceptions in PluginAPIError
@@ -260,6 +270,41 @@ class VaultEnvSource(PluginInterface):
                 original_error=e,
             ) from e
 
+    def refresh(self) -> dict[str, str]:
+        """Discard the cached secrets and read them from Vault again.
+
+        Returns:
+            Dictionary of environment variable name -> value mappings
+
+        Raises:
+            PluginAPIError: If Vault API call fails or authentication fails
+
+        Example:
+            >>> vault = VaultEnvSource(url="...", token="...", path="myapp/config")
+            >>> vault.load()
+            >>> # ... secrets rotated in Vault ...
+            >>> secrets = vault.refresh()
+        """
+        self._cache = None
+        return self.load()
+
+    async def arefresh(self) -> dict[str, str]:
+        """Re-read secrets from Vault without blocking the event loop.
+
+        hvac is synchronous, so the request runs in a worker thread. Use this
+        to rotate secrets from async code (e.g. a FastAPI lifespan task).
+
+        Returns:
+            Dictionary of environment variable name -> value mappings
+
+        Raises:
+            PluginAPIError: If Vault API call fails or authentication fails
+
+        Example:
+            >>> secrets = await vault.arefresh()
+        """
+        return await asyncio.to_thread(self.refresh)
+
     def validate_config(self, config: dict[str, Any]) -> bool:
         """Validate Vault plugin configuration.
 
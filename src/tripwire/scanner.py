@@ -7,7 +7,7 @@ in Python source files, extracting metadata about environment variables.
 import ast
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, Iterator, List, Optional, Set
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
 
 from tripwire.constants import SKIP_DIRS
 
@@ -359,6 +359,24 @@ def deduplicate_variables(variables: List[EnvVarInfo]) -> Dict[str, EnvVarInfo]:
     return seen
 
 
+def split_required(variables: Dict[str, EnvVarInfo]) -> Tuple[List[EnvVarInfo], List[EnvVarInfo]]:
+    """Partition variables into required and optional in a single pass.
+
+    Args:
+        variables: Deduplicated variables, as returned by deduplicate_variables()
+
+    Returns:
+        Tuple of (required, optional) lists, each in the input's iteration order
+    """
+    required: List[EnvVarInfo] = []
+    optional: List[EnvVarInfo] = []
+
+    for var in variables.values():
+        (required if var.required else optional).append(var)
+
+    return required, optional
+
+
 def format_var_for_env_example(var: EnvVarInfo, include_comments: bool = True) -> str:
     """Format a variable for .env.example file.
 
@@ -384,7 +402,7 @@ def format_var_for_env_example(var: EnvVarInfo, include_comments: bool = True) -
         if var.format:
             lines.append(f"# Format: {var.format}")
         if var.choices:
-            lines.append(f"# Choices: {', '.join(str(c) for c in var.choices)}")
+            lines.append(f"# Choices: {', '.join(map(str, var.choices))}")
         if var.min_val is not None or var.max_val is not None:
             range_parts = []
             if var.min_val is not None:
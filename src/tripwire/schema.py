@@ -8,6 +8,7 @@ enabling declarative configuration management.
 import re
 import tomllib  # Python 3.11+
 from dataclasses import dataclass, field
+from operator import attrgetter
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple, Union
 
@@ -359,8 +360,8 @@ class TripWireSchema:
         needs_input = []
 
         # Group by required/optional
-        required_vars = sorted([v for v in self.variables.values() if v.required], key=lambda v: v.name)
-        optional_vars = sorted([v for v in self.variables.values() if not v.required], key=lambda v: v.name)
+        required_vars = sorted([v for v in self.variables.values() if v.required], key=attrgetter("name"))
+        optional_vars = sorted([v for v in self.variables.values() if not v.required], key=attrgetter("name"))
 
         if required_vars:
             lines.append("# Required Variables")
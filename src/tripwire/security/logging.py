@@ -41,6 +41,33 @@ _secret_registry_lock = threading.Lock()
 _registered_secrets: Set[str] = set()
 _registered_patterns: list[Pattern[str]] = []
 
+# Immutable views of the registry, rebuilt on every change so that redaction
+# (which runs for every log record) needs no lock, copy or sort. Secrets are
+# ordered longest first so "abc123" is redacted before its substring "abc".
+_secrets_by_length: tuple[str, ...] = ()
+_patterns_snapshot: tuple[Pattern[str], ...] = ()
+
+
+def _refresh_snapshots() -> None:
+    """Rebuild the redaction snapshots. Caller must hold _secret_registry_lock."""
+    global _secrets_by_length, _patterns_snapshot
+    _secrets_by_length = tuple(sorted(_registered_secrets, key=len, reverse=True))
+    _patterns_snapshot = tuple(_registered_patterns)
+
+
+def _redact(text: str, mask: str, redact_secrets: bool = True, redact_patterns: bool = True) -> str:
+    """Replace registered secrets and pattern matches in text with mask."""
+    if redact_secrets:
+        for secret_value in _secrets_by_length:
+            if secret_value in text:
+                text = text.replace(secret_value, mask)
+
+    if redact_patterns:
+        for pattern in _patterns_snapshot:
+            text = pattern.sub(mask, text)
+
+    return text
+
 
 def register_secret(secret: str | Secret[str]) -> None:
     """Register a secret value for automatic redaction in logs.
@@ -71,6 +98,7 @@ def register_secret(secret: str | Secret[str]) -> None:
 
     with _secret_registry_lock:
         _registered_secrets.add(actual_value)
+        _refresh_snapshots()
 
 
 def unregister_secret(secret: str | Secret[str]) -> None:
@@ -91,6 +119,7 @@ def unregister_secret(secret: str | Secret[str]) -> None:
 
     with _secret_registry_lock:
         _registered_secrets.discard(actual_value)
+        _refresh_snapshots()
 
 
 def register_pattern(pattern: str | Pattern[str]) -> None:
@@ -115,6 +144,7 @@ def register_pattern(pattern: str | Pattern[str]) -> None:
 
     with _secret_registry_lock:
         _registered_patterns.append(compiled_pattern)
+        _refresh_snapshots()
 
 
 def clear_registry() -> None:
@@ -128,6 +158,7 @@ def clear_registry() -> None:
     with _secret_registry_lock:
         _registered_secrets.clear()
         _registered_patterns.clear()
+        _refresh_snapshots()
 
 
 class SecretRedactionFilter(logging.Filter):
@@ -207,32 +238,12 @@ class SecretRedactionFilter(logging.Filter):
         """
         # Get the formatted message (after f-strings, format(), etc.)
         original_msg = record.getMessage()
-
-        # Redact registered secrets (exact string matching)
-        if self.redact_secrets:
-            with _secret_registry_lock:
-                # Copy the set to avoid holding the lock during replacement
-                secrets_to_redact = _registered_secrets.copy()
-
-            # Sort by length (longest first) to handle substring secrets correctly
-            # Example: If both "abc123" and "abc" are secrets, redact "abc123" first
-            for secret_value in sorted(secrets_to_redact, key=len, reverse=True):
-                if secret_value in original_msg:
-                    original_msg = original_msg.replace(secret_value, self.mask)
-
-        # Redact pattern-matched secrets (regex matching)
-        if self.redact_patterns:
-            with _secret_registry_lock:
-                # Copy the list to avoid holding the lock during regex operations
-                patterns_to_check = _registered_patterns.copy()
-
-            for pattern in patterns_to_check:
-                original_msg = pattern.sub(self.mask, original_msg)
+        redacted_msg = _redact(original_msg, self.mask, self.redact_secrets, self.redact_patterns)
 
         # Update the record's message if it changed
-        if original_msg != record.getMessage():
+        if redacted_msg != original_msg:
             # Update both msg and args to prevent re-formatting from undoing redaction
-            record.msg = original_msg
+            record.msg = redacted_msg
             record.args = ()  # Clear args since we already formatted
 
         # Redact exception information (critical for security)
@@ -243,25 +254,8 @@ class SecretRedactionFilter(logging.Filter):
             # Format the exception into text
             exc_text = "".join(traceback.format_exception(*record.exc_info))
 
-            # Redact secrets from exception text
-            if self.redact_secrets:
-                with _secret_registry_lock:
-                    secrets_to_redact = _registered_secrets.copy()
-
-                for secret_value in sorted(secrets_to_redact, key=len, reverse=True):
-                    if secret_value in exc_text:
-                        exc_text = exc_text.replace(secret_value, self.mask)
-
-            # Redact pattern-matched secrets from exception text
-            if self.redact_patterns:
-                with _secret_registry_lock:
-                    patterns_to_check = _registered_patterns.copy()
-
-                for pattern in patterns_to_check:
-                    exc_text = pattern.sub(self.mask, exc_text)
-
             # Store the redacted exception text
-            record.exc_text = exc_text
+            record.exc_text = _redact(exc_text, self.mask, self.redact_secrets, self.redact_patterns)
             # Clear exc_info to prevent double formatting
             # (the formatted text is already in exc_text)
             record.exc_info = None
@@ -315,24 +309,8 @@ class SecretRedactionFormatter(logging.Formatter):
         Returns:
             Formatted and redacted log message
         """
-        # Format using parent formatter
-        formatted = super().format(record)
-
-        # Redact secrets (same logic as SecretRedactionFilter)
-        with _secret_registry_lock:
-            secrets_to_redact = _registered_secrets.copy()
-            patterns_to_check = _registered_patterns.copy()
-
-        # Redact exact matches
-        for secret_value in sorted(secrets_to_redact, key=len, reverse=True):
-            if secret_value in formatted:
-                formatted = formatted.replace(secret_value, self.mask)
-
-        # Redact pattern matches
-        for pattern in patterns_to_check:
-            formatted = pattern.sub(self.mask, formatted)
-
-        return formatted
+        # Format using parent formatter, then redact (same logic as SecretRedactionFilter)
+        return _redact(super().format(record), self.mask)
 
 
 def auto_install(
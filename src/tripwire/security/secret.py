@@ -90,8 +90,8 @@ Pickle Security:
 
 from __future__ import annotations
 
+import hmac
 import json
-import secrets
 from typing import Any, Generic, TypeVar
 
 # Generic type variable for Secret wrapper
@@ -99,6 +99,29 @@ T = TypeVar("T")
 
 # Mask character used for display
 MASK_STRING = "**********"
+_MASKED_REPR = f"Secret('{MASK_STRING}')"
+
+
+# Bound once so construction skips the attribute lookup on ``object`` (the same
+# trick dataclass-generated __init__ methods use for frozen classes)
+_object_setattr = object.__setattr__
+
+
+def _as_bytes(value: object) -> bytes | None:
+    """Return the bytes used for constant-time comparison, or None for other types."""
+    if isinstance(value, str):
+        return value.encode()
+    if isinstance(value, bytes):
+        return value
+    return None
+
+
+def _len_or_none(value: object) -> int | None:
+    """Return len(value), or None if the value has no length."""
+    try:
+        return len(value)  # type: ignore[arg-type]
+    except TypeError:
+        return None
 
 
 class Secret(Generic[T]):
@@ -137,8 +160,11 @@ class Secret(Generic[T]):
         >>> # Output: API key configured: **********
     """
 
-    __slots__ = ("_value",)  # Memory optimization + prevent attribute injection
+    __slots__ = ("_value", "_value_bytes", "_truthy", "_len")  # Memory optimization + prevent attribute injection
     _value: T  # Explicit attribute declaration for mypy type checking
+    _value_bytes: bytes | None  # Encoded str/bytes value, cached for __eq__
+    _truthy: bool  # bool(value), cached for __bool__
+    _len: int | None  # len(value), cached for __len__ (None if the value has no length)
 
     def __init__(self, value: T) -> None:
         """Initialize the secret wrapper.
@@ -151,7 +177,10 @@ class Secret(Generic[T]):
             >>> api_key = Secret("sk-abc123")
         """
         # Store in a "private" attribute (name mangling provides some protection)
-        object.__setattr__(self, "_value", value)
+        _object_setattr(self, "_value", value)
+        _object_setattr(self, "_value_bytes", _as_bytes(value))
+        _object_setattr(self, "_truthy", bool(value))
+        _object_setattr(self, "_len", _len_or_none(value))
 
     def get_secret_value(self) -> T:
         """Get the actual secret value (use with caution).
@@ -207,7 +236,22 @@ class Secret(Generic[T]):
             >>> token  # In interactive shell
             Secret('**********')
         """
-        return f"Secret('{MASK_STRING}')"
+        return _MASKED_REPR
+
+    def __format__(self, format_spec: str) -> str:
+        """Return the mask for f-strings and format(), honouring any format spec.
+
+        Without this, a non-empty spec such as ``f"{token:>20}"`` raises
+        TypeError from object.__format__.
+
+        Example:
+            >>> token = Secret("my_secret_token")
+            >>> f"[{token:>12}]"
+            '[  **********]'
+        """
+        if not format_spec:
+            return MASK_STRING
+        return format(MASK_STRING, format_spec)
 
     def __eq__(self, other: object) -> bool:
         """Compare secrets using constant-time comparison.
@@ -222,9 +266,11 @@ class Secret(Generic[T]):
             True if values are equal, False otherwise
 
         Security:
-            Uses secrets.compare_digest() for constant-time comparison when
+            Uses hmac.compare_digest() for constant-time comparison when
             comparing strings/bytes. For other types, falls back to standard
-            equality (which may be vulnerable to timing attacks).
+            equality (which may be vulnerable to timing attacks). The UTF-8
+            encoding of the wrapped value is cached at construction, so
+            comparisons don't re-encode it.
 
         Example:
             >>> secret1 = Secret("password123")
@@ -239,17 +285,16 @@ class Secret(Generic[T]):
         """
         # Get actual values for comparison
         if isinstance(other, Secret):
-            other_value = other.get_secret_value()
+            other_value = other._value
+            other_bytes = other._value_bytes
         else:
             other_value = other
+            other_bytes = _as_bytes(other)
 
         # Use constant-time comparison for strings and bytes (timing attack protection)
-        if isinstance(self._value, (str, bytes)) and isinstance(other_value, (str, bytes)):
-            # Convert both to bytes for comparison
-            self_bytes = self._value.encode() if isinstance(self._value, str) else self._value
-            other_bytes = other_value.encode() if isinstance(other_value, str) else other_value
-
-            return secrets.compare_digest(self_bytes, other_bytes)
+        self_bytes = self._value_bytes
+        if self_bytes is not None and other_bytes is not None:
+            return hmac.compare_digest(self_bytes, other_bytes)
 
         # For other types, use standard equality (no timing attack protection)
         return bool(self._value == other_value)
@@ -295,16 +340,18 @@ class Secret(Generic[T]):
             >>> len(token)
             15
         """
-        # Only works if underlying value has __len__
-        if hasattr(self._value, "__len__"):
-            return len(self._value)
-        else:
+        # Only works if underlying value has __len__ (computed once at construction)
+        length = self._len
+        if length is None:
             raise TypeError(f"object of type '{type(self._value).__name__}' has no len()")
+        return length
 
     def __bool__(self) -> bool:
         """Return truthiness of the secret value.
 
         This allows Secret wrappers to be used in boolean contexts (if statements, etc.).
+        The result is computed once at construction, since the wrapped value
+        is not expected to change.
 
         Returns:
             True if value is truthy, False otherwise
@@ -320,7 +367,7 @@ class Secret(Generic[T]):
             ...     print("Token is empty")
             Token is empty
         """
-        return bool(self._value)
+        return self._truthy
 
     # Prevent attribute assignment (immutability)
     def __setattr__(self, name: str, value: Any) -> None:
@@ -423,7 +470,11 @@ class Secret(Generic[T]):
         """
         # Bypass immutability for pickle deserialization
         # Use object.__setattr__ to avoid our __setattr__ override
-        object.__setattr__(self, "_value", state["_value"])
+        value = state["_value"]
+        _object_setattr(self, "_value", value)
+        _object_setattr(self, "_value_bytes", _as_bytes(value))
+        _object_setattr(self, "_truthy", bool(value))
+        _object_setattr(self, "_len", _len_or_none(value))
 
     # JSON serialization protection
     def __json__(self) -> str:
@@ -470,7 +521,7 @@ class SecretStr(Secret[str]):
         **********
     """
 
-    pass
+    __slots__ = ()
 
 
 class SecretBytes(Secret[bytes]):
@@ -483,7 +534,7 @@ class SecretBytes(Secret[bytes]):
         **********
     """
 
-    pass
+    __slots__ = ()
 
 
 # JSON encoder that handles Secret objects
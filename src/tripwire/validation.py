@@ -22,6 +22,7 @@ from __future__ import annotations
 
 import re
 import threading
+from functools import lru_cache
 from typing import (
     Any,
     Callable,
@@ -29,6 +30,7 @@ from typing import (
     List,
     Optional,
     Protocol,
+    Tuple,
     TypeVar,
     Union,
     cast,
@@ -72,6 +74,119 @@ _CUSTOM_VALIDATORS: Dict[str, ValidatorFunc] = {}
 _VALIDATOR_LOCK = threading.Lock()
 
 
+@lru_cache(maxsize=256)
+def _compile_pattern(pattern: str, flags: int = 0) -> re.Pattern[str]:
+    """Compile a regex pattern, reusing recent compilations.
+
+    The ``re`` module's internal cache is small and shared with every other
+    caller in the process, so user-supplied patterns (``pattern=`` in
+    ``require()``, ``required_path`` in URL validation) can be evicted and
+    recompiled repeatedly. This cache holds only validation patterns, and it
+    is bounded so a long-running process can't grow it without limit.
+
+    Args:
+        pattern: Regex pattern string
+        flags: Regex flags (default: none)
+
+    Returns:
+        Compiled regex pattern
+
+    Raises:
+        re.error: If pattern is not a valid regular expression
+    """
+    return re.compile(pattern, flags)
+
+
+# Characters with special meaning outside a character class
+_REGEX_METACHARS = frozenset(".^$*+?{}[]\\|()")
+_REGEX_QUANTIFIERS = frozenset("*+?{")
+
+
+def _has_top_level_alternation(pattern: str) -> bool:
+    """Check whether a regex contains ``|`` outside any group or class."""
+    depth = 0
+    in_class = False
+    i = 0
+    while i < len(pattern):
+        char = pattern[i]
+        if char == "\\":
+            i += 2
+            continue
+        if in_class:
+            if char == "]":
+                in_class = False
+        elif char == "[":
+            in_class = True
+            # A leading "]" (or "^]") is a literal member of the class
+            if pattern.startswith("]", i + 1):
+                i += 1
+            elif pattern.startswith("^]", i + 1):
+                i += 2
+        elif char == "(":
+            depth += 1
+        elif char == ")":
+            depth -= 1
+        elif char == "|" and depth == 0:
+            return True
+        i += 1
+    return False
+
+
+@lru_cache(maxsize=256)
+def _analyze_pattern(pattern: str) -> Tuple[str, re.Pattern[str]]:
+    """Split an anchored pattern into a literal prefix and a compiled remainder.
+
+    Patterns such as ``^sk_(test|live)_[a-zA-Z0-9]{12,}$`` start with a plain
+    string after the ``^`` anchor. That prefix can be checked with
+    ``str.startswith`` and the regex engine only has to match the rest,
+    starting at ``len(prefix)``. Patterns that cannot be split safely (no
+    leading ``^``, no literal prefix, or a top-level ``|``) are returned
+    whole with an empty prefix.
+
+    Args:
+        pattern: Regex pattern string
+
+    Returns:
+        Tuple of (literal prefix, compiled remainder pattern)
+
+    Raises:
+        re.error: If pattern is not a valid regular expression
+    """
+    compiled = _compile_pattern(pattern)
+    if not pattern.startswith("^") or _has_top_level_alternation(pattern):
+        return "", compiled
+
+    literal: List[str] = []
+    starts: List[int] = []  # Pattern index where each literal character begins
+    i = 1
+    while i < len(pattern):
+        char = pattern[i]
+        starts.append(i)
+        if char == "\\":
+            escaped = pattern[i + 1 : i + 2]
+            # Only escaped punctuation is a literal; \d, \w, \1 etc. are not
+            if not escaped or escaped.isalnum() or escaped == "_":
+                starts.pop()
+                break
+            literal.append(escaped)
+            i += 2
+        elif char in _REGEX_METACHARS:
+            starts.pop()
+            break
+        else:
+            literal.append(char)
+            i += 1
+
+    # A quantifier binds to the preceding character, so it can't be peeled
+    if literal and pattern[i : i + 1] in _REGEX_QUANTIFIERS:
+        literal.pop()
+        i = starts.pop()
+    if not literal:
+        return "", compiled
+
+    return "".join(literal), _compile_pattern(pattern[i:])
+
+
 def _parse_delimited_string(
     value: str,
     delimiter: str = ",",
@@ -114,6 +229,12 @@ def _parse_delimited_string(
     return items
 
 
+_TRUE_VALUES = frozenset({"true", "1", "yes", "on"})
+_FALSE_VALUES = frozenset({"false", "0", "no", "off"})
+_TRUE_SPELLINGS = _TRUE_VALUES | {v.capitalize() for v in _TRUE_VALUES} | {v.upper() for v in _TRUE_VALUES}
+_FALSE_SPELLINGS = _FALSE_VALUES | {v.capitalize() for v in _FALSE_VALUES} | {v.upper() for v in _FALSE_VALUES}
+
+
 def coerce_bool(value: str) -> bool:
     """Convert string to boolean.
 
@@ -130,9 +251,15 @@ def coerce_bool(value: str) -> bool:
     Raises:
         ValueError: If value cannot be interpreted as boolean
     """
-    if value.lower() in ("true", "1", "yes", "on"):
+    # Common spellings hit the exact-case sets without allocating a lowercased copy
+    if value in _TRUE_SPELLINGS:
+        return True
+    if value in _FALSE_SPELLINGS:
+        return False
+    lowered = value.lower()
+    if lowered in _TRUE_VALUES:
         return True
-    if value.lower() in ("false", "0", "no", "off"):
+    if lowered in _FALSE_VALUES:
         return False
     raise ValueError(f"Cannot interpret '{value}' as boolean")
 
@@ -339,6 +466,17 @@ def coerce_type(value: str, target_type: type[T], variable_name: str) -> T:
         raise TypeCoercionError(variable_name, value, target_type, e) from e
 
 
+# Pre-compiled patterns for built-in format validators.
+# Fixed ReDoS: Added upper bounds to all quantifiers
+# Local part: max 64 chars (RFC 5321), domain: max 255 chars, TLD: max 24 chars
+_EMAIL_PATTERN = re.compile(r"^[a-zA-Z0-9._%+-]{1,64}@[a-zA-Z0-9.-]{1,255}\.[a-zA-Z]{2,24}$")
+_URL_PATTERN = re.compile(r"^https?://[^\s/$.?#].[^\s]*$")
+_UUID_PATTERN = re.compile(
+    r"^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$",
+    re.IGNORECASE,
+)
+
+
 def validate_email(value: str) -> bool:
     """Validate email address format.
 
@@ -348,10 +486,11 @@ def validate_email(value: str) -> bool:
     Returns:
         True if valid email format
     """
-    # Fixed ReDoS: Added upper bounds to all quantifiers
-    # Local part: max 64 chars (RFC 5321), domain: max 255 chars, TLD: max 24 chars
-    pattern = r"^[a-zA-Z0-9._%+-]{1,64}@[a-zA-Z0-9.-]{1,255}\.[a-zA-Z]{2,24}$"
-    return bool(re.match(pattern, value))
+    # Fast reject: every valid address has an '@' followed by a dotted domain
+    _, at, domain = value.partition("@")
+    if not at or "." not in domain:
+        return False
+    return _EMAIL_PATTERN.match(value) is not None
 
 
 def validate_url(value: str) -> bool:
@@ -363,8 +502,9 @@ def validate_url(value: str) -> bool:
     Returns:
         True if valid URL format
     """
-    pattern = r"^https?://[^\s/$.?#].[^\s]*$"
-    return bool(re.match(pattern, value))
+    if not value.startswith(("http://", "https://")):
+        return False
+    return _URL_PATTERN.match(value) is not None
 
 
 def validate_uuid(value: str) -> bool:
@@ -376,8 +516,9 @@ def validate_uuid(value: str) -> bool:
     Returns:
         True if valid UUID format
     """
-    pattern = r"^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$"
-    return bool(re.match(pattern, value, re.IGNORECASE))
+    if len(value) != 36:
+        return False
+    return _UUID_PATTERN.match(value) is not None
 
 
 def validate_ipv4(value: str) -> bool:
@@ -389,13 +530,15 @@ def validate_ipv4(value: str) -> bool:
     Returns:
         True if valid IPv4 format
     """
-    pattern = r"^(\d{1,3}\.){3}\d{1,3}$"
-    if not re.match(pattern, value):
+    octets = value.split(".")
+    if len(octets) != 4:
         return False
 
-    # Check each octet is in valid range (0-255)
-    octets = [int(x) for x in value.split(".")]
-    return all(0 <= octet <= 255 for octet in octets)
+    # Each octet is 1-3 decimal digits in the range 0-255 (no regex needed)
+    for octet in octets:
+        if not 1 <= len(octet) <= 3 or not octet.isdecimal() or int(octet) > 255:
+            return False
+    return True
 
 
 def validate_postgresql_url(value: str) -> bool:
@@ -407,8 +550,7 @@ def validate_postgresql_url(value: str) -> bool:
     Returns:
         True if valid PostgreSQL URL format
     """
-    pattern = r"^postgres(ql)?://.*"
-    return bool(re.match(pattern, value))
+    return value.startswith(("postgresql://", "postgres://"))
 
 
 def validate_pattern(value: str, pattern: str) -> bool:
@@ -421,7 +563,8 @@ def validate_pattern(value: str, pattern: str) -> bool:
     Returns:
         True if value matches pattern
     """
-    return bool(re.match(pattern, value))
+    prefix, remainder = _analyze_pattern(pattern)
+    return value.startswith(prefix) and remainder.match(value, len(prefix)) is not None
 
 
 def validate_range(
@@ -570,7 +713,7 @@ def validate_url_components(
     if required_path is not None:
         if not parsed.path:
             return False, f"URL path missing. Required pattern: {required_path}"
-        if not re.match(required_path, parsed.path):
+        if _compile_pattern(required_path).match(parsed.path) is None:
             return False, f"URL path '{parsed.path}' does not match required pattern: {required_path}"
 
     # Validate query parameters
@@ -767,11 +910,10 @@ def register_validator(name: str, validator_func: ValidatorFunc) -> None:
         >>> register_validator("phone", validate_phone)
         >>> # Now can use format="phone" in require()
     """
-    built_in_validators = set(_BUILTIN_VALIDATORS.keys())
-    if name in built_in_validators:
+    if name in _BUILTIN_VALIDATORS:
         raise ValueError(
             f"Cannot register validator '{name}': conflicts with built-in validator. "
-            f"Built-in validators: {', '.join(sorted(built_in_validators))}"
+            f"Built-in validators: {', '.join(sorted(_BUILTIN_VALIDATORS))}"
         )
 
     with _VALIDATOR_LOCK:
@@ -836,14 +978,37 @@ def get_validator(name: str) -> Optional[ValidatorFunc]:
         Validator function or None if not found
     """
     # Check built-in validators first (immutable, no lock needed)
-    if name in _BUILTIN_VALIDATORS:
-        return _BUILTIN_VALIDATORS[name]
+    builtin = _BUILTIN_VALIDATORS.get(name)
+    if builtin is not None:
+        return builtin
 
     # Then check custom validators (thread-safe access)
     with _VALIDATOR_LOCK:
         return _CUSTOM_VALIDATORS.get(name)
 
 
+def validate_format(value: str, format_name: str) -> bool:
+    """Validate value with a named format validator (built-in or custom).
+
+    Results are not cached: values may be secrets, and a process-wide cache
+    keyed on them would keep the plaintext alive after the variable is gone.
+
+    Args:
+        value: Value to validate
+        format_name: Name of the format validator
+
+    Returns:
+        True if value matches the format
+
+    Raises:
+        ValueError: If no validator is registered under format_name
+    """
+    validator_func = get_validator(format_name)
+    if validator_func is None:
+        raise ValueError(f"Unknown format validator: {format_name}")
+    return validator_func(value)
+
+
 def list_validators() -> Dict[str, str]:
     """List all available validators (built-in and custom, thread-safe).
 
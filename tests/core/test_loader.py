@@ -173,6 +173,16 @@ ANOTHER_VAR=value2
         # Should handle multiple = signs correctly
         assert "DATABASE_URL" in loaded
 
+    def test_load_file_with_irregular_whitespace(self, tmp_path):
+        """Test that indentation, CRLF endings and indented comments are handled."""
+        env_file = tmp_path / ".env"
+        env_file.write_bytes(b"  INDENTED = padded  \r\n\t# indented comment\r\nNO_VALUE\r\nEMPTY=\r\nLAST=1")
+
+        source = DotenvFileSource(env_file, override=False)
+        loaded = source.load()
+
+        assert loaded == {"INDENTED": "padded", "EMPTY": "", "LAST": "1"}
+
 
 class TestEnvFileLoader:
     """Test suite for EnvFileLoader."""
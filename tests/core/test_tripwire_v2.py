@@ -503,6 +503,246 @@ class TestThreadSafety:
         assert len(registry) >= 20
 
 
+class TestRequireMany:
+    """Test batch variable resolution with require_many()."""
+
+    def test_resolves_all_specs(self, monkeypatch):
+        """Test that every spec is resolved, coerced and validated."""
+        env = TripWireV2(auto_load=False, collect_errors=False)
+        monkeypatch.setenv("DATABASE_URL", "postgresql://localhost/db")
+        monkeypatch.setenv("PORT", "8080")
+        monkeypatch.setenv("DEBUG", "true")
+        monkeypatch.delenv("TIMEOUT", raising=False)
+
+        config = env.require_many(
+            [
+                {"name": "DATABASE_URL", "format": "postgresql"},
+                {"name": "PORT", "type": int, "min_val": 1, "max_val": 65535},
+                {"name": "DEBUG", "default": False},
+                {"name": "TIMEOUT", "default": 30.0},
+            ]
+        )
+
+        assert config == {"DATABASE_URL": "postgresql://localhost/db", "PORT": 8080, "DEBUG": True, "TIMEOUT": 30.0}
+        assert env.get_registry()["DEBUG"]["type"] == "bool"
+
+    def test_fail_fast_reports_all_errors_together(self, monkeypatch):
+        """Test that fail-fast mode raises once with every failure."""
+        from tripwire.exceptions import TripWireMultiValidationError
+
+        env = TripWireV2(auto_load=False, collect_errors=False)
+        monkeypatch.delenv("MISSING_VAR", raising=False)
+        monkeypatch.setenv("BAD_PORT", "not-a-number")
+        monkeypatch.setenv("BAD_LEVEL", "TRACE")
+
+        with pytest.raises(TripWireMultiValidationError) as exc_info:
+            env.require_many(
+                [
+                    {"name": "MISSING_VAR"},
+                    {"name": "BAD_PORT", "type": int},
+                    {"name": "BAD_LEVEL", "choices": ["INFO", "DEBUG"]},
+                ]
+            )
+
+        assert [e.variable_name for e in exc_info.value.errors] == ["MISSING_VAR", "BAD_PORT", "BAD_LEVEL"]
+
+    def test_fail_fast_single_error(self, monkeypatch):
+        """Test that a single failure is raised with the same type require() uses."""
+        from tripwire.exceptions import TypeCoercionError
+
+        env = TripWireV2(auto_load=False, collect_errors=False)
+        monkeypatch.delenv("MISSING_VAR", raising=False)
+        monkeypatch.setenv("BAD_PORT", "not-a-number")
+        monkeypatch.setenv("BAD_LEVEL", "TRACE")
+
+        with pytest.raises(MissingVariableError, match="MISSING_VAR"):
+            env.require_many([{"name": "MISSING_VAR"}])
+        with pytest.raises(TypeCoercionError):
+            env.require_many([{"name": "BAD_PORT", "type": int}])
+        with pytest.raises(ValidationError, match="BAD_LEVEL"):
+            env.require_many([{"name": "BAD_LEVEL", "choices": ["INFO", "DEBUG"]}])
+
+    def test_dict_spec_without_name(self):
+        """Test that a dict spec missing its name is rejected with a clear error."""
+        env = TripWireV2(auto_load=False, collect_errors=False)
+
+        with pytest.raises(ValueError, match="no 'name' key"):
+            env.require_many([{"type": int, "default": 8000}])
+
+    def test_tuple_and_name_specs(self, monkeypatch):
+        """Test that (name, options) tuples and bare names are accepted."""
+        from tripwire.security import Secret
+
+        env = TripWireV2(auto_load=False, collect_errors=False)
+        monkeypatch.setenv("VAULT_TOKEN", "hvs.secret-token")
+        monkeypatch.setenv("VAULT_HOST", "vault.internal")
+
+        config = env.require_many([("VAULT_TOKEN", {"secret": True}), "VAULT_HOST"])
+
+        assert isinstance(config["VAULT_TOKEN"], Secret)
+        assert config["VAULT_TOKEN"].get_secret_value() == "hvs.secret-token"
+        assert config["VAULT_HOST"] == "vault.internal"
+
+    def test_collect_mode_defers_errors(self, monkeypatch):
+        """Test that collect mode stores errors on the instance."""
+        env = TripWireV2(auto_load=False, collect_errors=True)
+        monkeypatch.delenv("MISSING_VAR", raising=False)
+
+        config = env.require_many([{"name": "MISSING_VAR", "type": int}])
+
+        assert config == {"MISSING_VAR": 0}
+        assert [e.variable_name for e in env.get_validation_errors()] == ["MISSING_VAR"]
+        env._validation_errors.clear()
+
+
+class TestBind:
+    """Test bind() getters."""
+
+    def test_getter_reads_current_value(self, monkeypatch):
+        """Test that a bound getter coerces the value at call time."""
+        monkeypatch.setenv("BIND_PORT", "8000")
+        env = TripWireV2(auto_load=False, collect_errors=False)
+        get_port = env.bind("BIND_PORT", type=int)
+
+        assert get_port() == 8000
+        monkeypatch.setenv("BIND_PORT", "9000")
+        assert get_port() == 9000
+        assert "BIND_PORT" in env.get_registry()
+
+    def test_secret_getter_wraps_value(self, monkeypatch):
+        """Test that secret=True returns a Secret registered for redaction."""
+        from tripwire.security.logging import _registered_secrets, unregister_secret
+        from tripwire.security.secret import Secret
+
+        monkeypatch.setenv("BIND_TOKEN", "bind-secret-value")
+        env = TripWireV2(auto_load=False, collect_errors=False)
+        get_token = env.bind("BIND_TOKEN", secret=True)
+
+        token = get_token()
+        try:
+            assert isinstance(token, Secret)
+            assert token.get_secret_value() == "bind-secret-value"
+            assert "bind-secret-value" in _registered_secrets
+        finally:
+            unregister_secret("bind-secret-value")
+
+    def test_missing_variable_raises_on_bind(self, monkeypatch):
+        """Test that binding validates up front and does not register an unchecked variable."""
+        monkeypatch.delenv("BIND_MISSING", raising=False)
+        env = TripWireV2(auto_load=False, collect_errors=False)
+
+        with pytest.raises(MissingVariableError):
+            env.bind("BIND_MISSING", type=int)
+
+    def test_invalid_value_raises_on_bind(self, monkeypatch):
+        """Test that a value that can't be coerced fails at bind time."""
+        from tripwire.exceptions import TypeCoercionError
+
+        monkeypatch.setenv("BIND_BAD_PORT", "not-a-number")
+        env = TripWireV2(auto_load=False, collect_errors=False)
+
+        with pytest.raises(TypeCoercionError):
+            env.bind("BIND_BAD_PORT", type=int)
+
+    def test_variable_removed_after_bind_raises_on_call(self, monkeypatch):
+        """Test that the getter raises if the variable disappears after binding."""
+        monkeypatch.setenv("BIND_LATER_MISSING", "value")
+        env = TripWireV2(auto_load=False, collect_errors=False)
+        get_value = env.bind("BIND_LATER_MISSING")
+
+        monkeypatch.delenv("BIND_LATER_MISSING")
+        with pytest.raises(MissingVariableError):
+            get_value()
+
+
+class TestEnvSnapshot:
+    """Test snapshot_env=True lookups and reload()."""
+
+    def test_snapshot_ignores_later_changes_until_reload(self, monkeypatch):
+        """Test that snapshot lookups only see os.environ as of the last reload."""
+        monkeypatch.setenv("SNAPSHOT_VAR", "before")
+        env = TripWireV2(auto_load=False, collect_errors=False, snapshot_env=True)
+        monkeypatch.setenv("SNAPSHOT_VAR", "after")
+        monkeypatch.setenv("SNAPSHOT_NEW", "1")
+
+        assert env.require("SNAPSHOT_VAR") == "before"
+        assert env.get("SNAPSHOT_VAR") == "before"
+        assert not env.has("SNAPSHOT_NEW")
+
+        env.reload()
+
+        assert env.require("SNAPSHOT_VAR") == "after"
+        assert env.has("SNAPSHOT_NEW")
+        assert env.all()["SNAPSHOT_NEW"] == "1"
+
+    def test_load_refreshes_snapshot(self, tmp_path, monkeypatch):
+        """Test that loading a .env file updates the snapshot."""
+        monkeypatch.setenv("SNAPSHOT_FROM_FILE", "stale")
+        env_file = tmp_path / ".env"
+        env_file.write_text("SNAPSHOT_FROM_FILE=loaded\n")
+        env = TripWireV2(auto_load=False, collect_errors=False, snapshot_env=True)
+
+        env.load(env_file, override=True)
+
+        assert env.get("SNAPSHOT_FROM_FILE") == "loaded"
+
+    def test_default_reads_environ_live(self, monkeypatch):
+        """Test that without snapshot_env lookups always see os.environ."""
+        env = TripWireV2(auto_load=False, collect_errors=False)
+        monkeypatch.setenv("SNAPSHOT_LIVE", "now")
+
+        assert env.get("SNAPSHOT_LIVE") == "now"
+
+    def test_require_memoized_until_reload(self, monkeypatch):
+        """Test that identical require() calls reuse the result until reload()."""
+        monkeypatch.setenv("SNAPSHOT_PORT", "8080")
+        env = TripWireV2(auto_load=False, collect_errors=False, snapshot_env=True)
+        calls = []
+
+        def counting_validator(value):
+            calls.append(value)
+            return True
+
+        first = env.require("SNAPSHOT_PORT", type=int, validator=counting_validator)
+        second = env.require("SNAPSHOT_PORT", type=int, validator=counting_validator)
+        as_str = env.require("SNAPSHOT_PORT", type=str)
+
+        assert first == second == 8080
+        assert as_str == "8080"
+        assert len(calls) == 1
+
+        monkeypatch.setenv("SNAPSHOT_PORT", "9090")
+        env.reload()
+
+        assert env.require("SNAPSHOT_PORT", type=int, validator=counting_validator) == 9090
+        assert len(calls) == 2
+
+    def test_memo_key_covers_every_option(self, monkeypatch):
+        """Test that list choices are memoized by content and any differing option is a new key."""
+        monkeypatch.setenv("SNAPSHOT_LEVEL_OK", "INFO")
+        env = TripWireV2(auto_load=False, collect_errors=False, snapshot_env=True)
+
+        env.require("SNAPSHOT_LEVEL_OK", choices=["DEBUG", "INFO"])
+        env.require("SNAPSHOT_LEVEL_OK", choices=["DEBUG", "INFO"])
+        assert len(env._resolved) == 1
+
+        with pytest.raises(ValidationError):
+            env.require("SNAPSHOT_LEVEL_OK", choices=["DEBUG", "INFO"], max_length=3)
+        env.require("SNAPSHOT_LEVEL_OK", choices=["DEBUG", "INFO"], description="Log level")
+        assert len(env._resolved) == 2
+
+    def test_failed_require_not_memoized(self, monkeypatch):
+        """Test that collected errors are reported on every failing call."""
+        monkeypatch.setenv("SNAPSHOT_LEVEL", "TRACE")
+        env = TripWireV2(auto_load=False, collect_errors=True, snapshot_env=True)
+
+        env.require("SNAPSHOT_LEVEL", choices=["DEBUG", "INFO"])
+        env.require("SNAPSHOT_LEVEL", choices=["DEBUG", "INFO"])
+
+        assert len(env.get_validation_errors()) == 2
+        env._validation_errors.clear()
+
+
 class TestLoadMethods:
     """Test file loading methods."""
 
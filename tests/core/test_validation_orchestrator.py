@@ -194,6 +194,16 @@ class TestChoicesValidationRule:
         with pytest.raises(ValidationError):
             rule.validate(context2)
 
+    def test_choices_frozen_once(self):
+        """Test the lookup set is built at construction and reused by every check."""
+        rule = ChoicesValidationRule(["dev", "staging", "prod"])
+        choice_set = rule._choice_set
+        assert choice_set == frozenset({"dev", "staging", "prod"})
+
+        for value in ("dev", "prod"):
+            rule.validate(ValidationContext(name="ENV", raw_value=value, coerced_value=value, expected_type=str))
+        assert rule._choice_set is choice_set
+
     def test_custom_error_message(self):
         """Test custom error message for choices."""
         rule = ChoicesValidationRule(["a", "b"], error_message="Invalid environment!")
@@ -674,6 +674,59 @@ class TestVaultEnvSourceLoad:
         # Only simple key should be present
         assert result == {"SIMPLE_KEY": "value"}
 
+    def test_load_reads_vault_once_until_refresh(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that load() serves cached secrets and refresh() re-reads Vault."""
+        from tripwire.plugins.sources.vault import VaultEnvSource
+
+        mock_client = Mock()
+        mock_client.is_authenticated.return_value = True
+        mock_client.secrets.kv.v2.read_secret_version.return_value = {"data": {"data": {"API_KEY": "old"}}}
+
+        mock_hvac = Mock()
+        mock_hvac.Client.return_value = mock_client
+        monkeypatch.setitem(__import__("sys").modules, "hvac", mock_hvac)
+
+        vault = VaultEnvSource(
+            url="https://vault.test.com",
+            token="hvs.test",
+            path="myapp/config",
+        )
+
+        first = vault.load()
+        first["API_KEY"] = "mutated"  # Callers get a copy, not the cache
+        assert vault.load() == {"API_KEY": "old"}
+        assert mock_client.secrets.kv.v2.read_secret_version.call_count == 1
+
+        mock_client.secrets.kv.v2.read_secret_version.return_value = {"data": {"data": {"API_KEY": "new"}}}
+
+        assert vault.refresh() == {"API_KEY": "new"}
+        assert mock_client.secrets.kv.v2.read_secret_version.call_count == 2
+
+    def test_arefresh_rereads_vault(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that arefresh() re-reads Vault from async code."""
+        import asyncio
+
+        from tripwire.plugins.sources.vault import VaultEnvSource
+
+        mock_client = Mock()
+        mock_client.is_authenticated.return_value = True
+        mock_client.secrets.kv.v2.read_secret_version.return_value = {"data": {"data": {"API_KEY": "old"}}}
+
+        mock_hvac = Mock()
+        mock_hvac.Client.return_value = mock_client
+        monkeypatch.setitem(__import__("sys").modules, "hvac", mock_hvac)
+
+        vault = VaultEnvSource(
+            url="https://vault.test.com",
+            token="hvs.test",
+            path="myapp/config",
+        )
+        vault.load()
+        mock_client.secrets.kv.v2.read_secret_version.return_value = {"data": {"data": {"API_KEY": "new"}}}
+
+        assert asyncio.run(vault.arefresh()) == {"API_KEY": "new"}
+        assert vault.load() == {"API_KEY": "new"}
+
 
 class TestAWSSecretsSourceLoad:
     """Tests for AWSSecretsSource.load() method with mocked boto3 library."""
@@ -152,6 +152,20 @@ class TestSecretRedactionFilter:
         assert "secret3" not in output
         assert output.count(MASK_STRING) == 3
 
+    def test_filter_stops_redacting_after_unregister(self, logger):
+        """Test that unregistering a secret takes effect for later records."""
+        test_logger, log_capture = logger
+        test_logger.handlers[0].addFilter(SecretRedactionFilter())
+
+        register_secret("rotated_token")
+        test_logger.info("first: rotated_token")
+        unregister_secret("rotated_token")
+        test_logger.info("second: rotated_token")
+
+        output = log_capture.getvalue()
+        assert f"first: {MASK_STRING}" in output
+        assert "second: rotated_token" in output
+
     def test_filter_handles_substring_secrets(self, logger):
         """Test that longer secrets are redacted before shorter ones."""
         test_logger, log_capture = logger
@@ -101,6 +101,13 @@ class TestSecretMasking:
         assert message == f"Token: {MASK_STRING}"
         assert "my_secret" not in message
 
+    def test_format_spec_masking(self):
+        """Test that format specs apply to the mask instead of raising."""
+        secret = Secret("my_secret")
+
+        assert f"{secret:>12}" == f"  {MASK_STRING}"
+        assert "{:<12}|".format(secret) == f"{MASK_STRING}  |"
+
 
 class TestSecretComparison:
     """Test secret comparison operations."""
@@ -136,10 +143,16 @@ class TestSecretComparison:
         secret2 = Secret("password123")
         secret3 = Secret("different")
 
-        # Should use secrets.compare_digest internally
+        # Should use hmac.compare_digest internally
         assert secret1 == secret2
         assert secret1 != secret3
 
+    def test_equality_across_str_and_bytes(self):
+        """Test that str and bytes secrets compare by their UTF-8 encoding."""
+        assert Secret("pässword") == Secret("pässword".encode())
+        assert Secret(b"token") == "token"
+        assert Secret("token") != Secret(b"other")
+
 
 class TestSecretHashing:
     """Test secret hashing for use in dicts/sets."""
@@ -243,6 +256,11 @@ class TestSecretImmutability:
 
         assert not hasattr(secret, "__dict__")
 
+    def test_subclasses_have_no_dict(self):
+        """Test that SecretStr and SecretBytes keep the slot-only layout."""
+        assert not hasattr(SecretStr("my_secret"), "__dict__")
+        assert not hasattr(SecretBytes(b"my_secret"), "__dict__")
+
 
 class TestSecretJSONSerialization:
     """Test JSON serialization protection."""
@@ -305,6 +323,17 @@ class TestSecretPickleSerialization:
         # But the repr is still masked
         assert repr(unpickled) == f"Secret('{MASK_STRING}')"
 
+    def test_pickle_preserves_equality(self):
+        """Test that unpickled secrets still compare equal to the original."""
+        secret = Secret("my_secret")
+        unpickled = pickle.loads(pickle.dumps(secret))
+
+        assert unpickled == secret
+        assert unpickled == "my_secret"
+        assert bool(unpickled) is True
+        assert len(unpickled) == len("my_secret")
+        assert bool(pickle.loads(pickle.dumps(Secret("")))) is False
+
 
 class TestSecretUtilities:
     """Test utility functions for working with secrets."""
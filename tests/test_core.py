@@ -247,3 +247,32 @@ class TestLoadMethod:
         instance = TripWire(auto_load=False, strict=False)
         # Should not raise
         instance.load(tmp_path / ".env.missing")
+
+
+class TestLazyImports:
+    """Tests for deferred loading of rarely used modules."""
+
+    def test_import_does_not_load_legacy_or_plugins(self, tmp_path: Path) -> None:
+        """Test that importing tripwire skips the legacy core and plugin system."""
+        import subprocess
+        import sys
+
+        code = (
+            "import sys, tripwire; "
+            "print('tripwire._core_legacy' in sys.modules, 'tripwire.core.plugin_system' in sys.modules)"
+        )
+        result = subprocess.run([sys.executable, "-c", code], cwd=tmp_path, capture_output=True, text=True, check=True)
+        assert result.stdout.strip() == "False False"
+
+    def test_lazy_attributes_resolve(self) -> None:
+        """Test that lazily imported names are still accessible."""
+        import tripwire
+        import tripwire.core
+        from tripwire._core_legacy import TripWireLegacy
+        from tripwire.core.plugin_system import PluginRegistry
+
+        assert tripwire.TripWireLegacy is TripWireLegacy
+        assert tripwire.core.PluginRegistry is PluginRegistry
+
+        with pytest.raises(AttributeError):
+            tripwire.does_not_exist  # noqa: B018
@@ -256,6 +256,35 @@ class TestSecretSearch:
         assert all(isinstance(occ, FileOccurrence) for occ in occurrences)
         assert all(occ.commit_hash == first_commit for occ in occurrences)
 
+    def test_find_secret_in_commit_compiled_pattern(self, git_repo_with_secret: Path) -> None:
+        """Test a precompiled pattern finds the same occurrences as its string form."""
+        import re
+
+        result = run_git_command(["rev-parse", "HEAD"], git_repo_with_secret)
+        commit_hash = result.stdout.strip()
+
+        from_string = find_secret_in_commit(commit_hash, r"aws_secret_key", git_repo_with_secret)
+        from_compiled = find_secret_in_commit(
+            commit_hash,
+            re.compile(r"aws_secret_key", re.IGNORECASE),
+            git_repo_with_secret,
+        )
+
+        assert len(from_string) > 0
+        assert from_compiled == from_string
+
+    def test_find_secret_in_commit_anchored_pattern(self, temp_git_repo: Path) -> None:
+        """Test ^/$ anchors match on every line, not just the first and last."""
+        (temp_git_repo / "config.env").write_text("DEBUG=true\nAPI_TOKEN=abc\nPORT=8000\n")
+        subprocess.run(["git", "add", "config.env"], cwd=temp_git_repo, check=True, capture_output=True)
+        subprocess.run(["git", "commit", "-m", "Add config"], cwd=temp_git_repo, check=True, capture_output=True)
+
+        end_anchored = find_secret_in_commit("HEAD", r"abc$", temp_git_repo)
+        start_anchored = find_secret_in_commit("HEAD", r"^API_TOKEN", temp_git_repo)
+
+        assert [occ.line_number for occ in end_anchored] == [2]
+        assert [occ.line_number for occ in start_anchored] == [2]
+
     def test_find_secret_not_in_commit(self, git_repo_clean: Path) -> None:
         """Test searching for a secret that doesn't exist."""
         result = run_git_command(["rev-parse", "HEAD"], git_repo_clean)
@@ -373,6 +402,75 @@ class TestSecretTimeline:
         # Should find it in multiple files
         assert len(timeline.files_affected) >= 2
 
+    def test_analyze_secret_git_grep_matches_fallback(self, git_repo_with_secret: Path, monkeypatch) -> None:
+        """Test the git grep search finds the same occurrences as reading each commit."""
+        from tripwire import git_audit
+
+        def locations(timeline):
+            return sorted((o.commit_hash, o.file_path, o.line_number, o.context) for o in timeline.occurrences)
+
+        grep_timeline = analyze_secret_history(secret_name="AWS_SECRET_KEY", repo_path=git_repo_with_secret)
+
+        monkeypatch.setattr(git_audit, "_git_grep_accepts", lambda pattern, repo_path: False)
+        fallback_timeline = analyze_secret_history(secret_name="AWS_SECRET_KEY", repo_path=git_repo_with_secret)
+
+        assert grep_timeline.total_occurrences > 0
+        assert locations(grep_timeline) == locations(fallback_timeline)
+        assert grep_timeline.is_currently_in_git == fallback_timeline.is_currently_in_git
+
+    def test_analyze_secret_parallel_matches_sequential(self, git_repo_with_secret: Path) -> None:
+        """Test searching commits concurrently gives the same occurrences in the same order."""
+        sequential = analyze_secret_history(
+            secret_name="AWS_SECRET_KEY",
+            repo_path=git_repo_with_secret,
+            num_workers=1,
+        )
+        parallel = analyze_secret_history(
+            secret_name="AWS_SECRET_KEY",
+            repo_path=git_repo_with_secret,
+            num_workers=4,
+        )
+
+        assert sequential.total_occurrences > 0
+        assert parallel.occurrences == sequential.occurrences
+        assert parallel.commits_affected == sequential.commits_affected
+
+    def test_parallel_search_stops_workers_when_closed(self, tmp_path: Path) -> None:
+        """Test closing the parallel search early stops workers instead of draining their batches."""
+        import itertools
+        from contextlib import closing
+
+        from tripwire import git_audit
+
+        occurrence = FileOccurrence(
+            file_path=".env",
+            line_number=1,
+            commit_hash="abc123",
+            commit_date=datetime(2024, 1, 1),
+            author="Test",
+            author_email="test@example.com",
+            commit_message="msg",
+        )
+
+        def endless_search(commit_hashes, secret_pattern, repo_path):
+            yield from itertools.repeat(occurrence)
+
+        search = git_audit._search_commits_parallel(endless_search, ["a", "b", "c", "d"], "SECRET", tmp_path, 4)
+        with closing(search) as occurrences:
+            assert list(itertools.islice(occurrences, 3)) == [occurrence] * 3
+        # Returning at all means the endless workers were told to stop
+
+    def test_parallel_search_propagates_worker_errors(self, tmp_path: Path) -> None:
+        """Test an exception raised in a worker surfaces in the caller."""
+        from tripwire import git_audit
+
+        def failing_search(commit_hashes, secret_pattern, repo_path):
+            raise GitCommandError(command="git grep", stderr="boom", returncode=128)
+            yield
+
+        with pytest.raises(GitCommandError):
+            list(git_audit._search_commits_parallel(failing_search, ["a", "b"], "SECRET", tmp_path, 2))
+
     def test_analyze_secret_max_commits(self, git_repo_with_secret: Path) -> None:
         """Test max_commits parameter."""
         timeline = analyze_secret_history(
@@ -894,24 +992,31 @@ class TestErrorHandling:
         result = run_git_command(["rev-parse", "HEAD"], temp_git_repo)
         commit_hash = result.stdout.strip()
 
-        # Mock git show to fail
-        original_func = run_git_command
-
-        def mock_run(*args, **kwargs):
-            if "show" in args[0] and ":" in str(args[0]):
-                from subprocess import CompletedProcess
-
-                return CompletedProcess(args=[], returncode=1, stdout="", stderr="error")
-            return original_func(*args, **kwargs)
-
+        # Mock blob reads to fail
         from tripwire import git_audit
 
-        monkeypatch.setattr(git_audit, "run_git_command", mock_run)
+        monkeypatch.setattr(git_audit.GitCatFile, "read_blob", lambda self, spec: None)
 
         occurrences = find_secret_in_commit(commit_hash, "SECRET", temp_git_repo)
         # Should return empty list when file can't be read
         assert len(occurrences) == 0
 
+    def test_git_cat_file_reads_blobs(self, temp_git_repo: Path) -> None:
+        """Test GitCatFile serves several reads from one process."""
+        from tripwire.git_audit import GitCatFile
+
+        (temp_git_repo / "a.txt").write_text("first\r\nline\n")
+        (temp_git_repo / "b.txt").write_text("second\n")
+        subprocess.run(["git", "add", "a.txt", "b.txt"], cwd=temp_git_repo, check=True, capture_output=True)
+        subprocess.run(["git", "commit", "-m", "Add files"], cwd=temp_git_repo, check=True, capture_output=True)
+
+        with GitCatFile(temp_git_repo) as cat_file:
+            assert cat_file.read_text("HEAD:a.txt") == "first\nline\n"
+            assert cat_file.read_blob("HEAD:b.txt") == b"second\n"
+            assert cat_file.read_blob("HEAD:missing.txt") is None
+            assert cat_file.read_blob("HEAD") is None  # Commit, not a blob
+            assert cat_file.read_blob("HEAD:b.txt") == b"second\n"
+
     def test_get_affected_branches_git_error(self, temp_git_repo: Path, monkeypatch) -> None:
         """Test get_affected_branches when git command fails."""
 
@@ -8,7 +8,9 @@ import pytest
 from tripwire.parser import (
     EnvFileParser,
     compare_env_files,
+    compare_env_vars,
     format_env_file,
+    merge_env_entries,
     merge_env_files,
     needs_quoting,
     parse_env_file,
@@ -224,6 +226,18 @@ def test_compare_env_files_missing_env():
         assert common == []
 
 
+def test_compare_env_vars():
+    """Test comparing already-parsed variables without touching disk."""
+    missing, extra, common = compare_env_vars(
+        {"VAR1": "value1", "EXTRA": "x"},
+        {"VAR1": "", "VAR3": ""},
+    )
+
+    assert missing == ["VAR3"]
+    assert extra == ["EXTRA"]
+    assert common == ["VAR1"]
+
+
 def test_needs_quoting():
     """Test the needs_quoting function."""
     assert needs_quoting("simple") is False
@@ -352,6 +366,18 @@ def test_merge_env_files_nonexistent():
         assert "VAR2=value2" in merged
 
 
+def test_merge_env_entries_matches_merge_env_files():
+    """Test merging into pre-parsed entries gives the same content as merging from disk."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        env_file = Path(tmpdir) / ".env"
+        env_file.write_text("# Database\nDB_HOST=localhost\nVAR1=original_value\n")
+
+        new_vars = {"VAR1": "new_value", "VAR2": "value2"}
+        entries = EnvFileParser().parse_file(env_file)
+
+        assert merge_env_entries(entries, new_vars) == merge_env_files(env_file, new_vars)
+
+
 def test_parse_inline_comments():
     """Test handling inline comments."""
     content = """
@@ -12,6 +12,7 @@ from tripwire.scanner import (
     format_var_for_env_example,
     scan_directory,
     scan_file,
+    split_required,
 )
 
 
@@ -287,6 +288,35 @@ def test_deduplicate_variables():
     assert unique["API_KEY"].description == "API key"
 
 
+def test_split_required():
+    """Test partitioning variables into required and optional, preserving order."""
+
+    def make(name: str, required: bool) -> EnvVarInfo:
+        return EnvVarInfo(
+            name=name,
+            required=required,
+            var_type="str",
+            default=None,
+            description=None,
+            format=None,
+            pattern=None,
+            choices=None,
+            min_val=None,
+            max_val=None,
+            secret=False,
+            file_path=Path("app.py"),
+            line_number=1,
+        )
+
+    variables = {v.name: v for v in [make("B", True), make("A", False), make("C", True), make("D", False)]}
+
+    required, optional = split_required(variables)
+
+    assert [v.name for v in required] == ["B", "C"]
+    assert [v.name for v in optional] == ["A", "D"]
+    assert split_required({}) == ([], [])
+
+
 def test_format_default_value():
     """Test formatting default values."""
     assert format_default_value(None) == ""
@@ -1,17 +1,24 @@
 """Tests for validation functions."""
 
+import re
+
 import pytest
 
 from tripwire.exceptions import TypeCoercionError
 from tripwire.validation import (
+    _analyze_pattern,
+    _compile_pattern,
+    clear_custom_validators,
     coerce_bool,
     coerce_dict,
     coerce_float,
     coerce_int,
     coerce_list,
     coerce_type,
+    register_validator,
     validate_choices,
     validate_email,
+    validate_format,
     validate_ipv4,
     validate_pattern,
     validate_postgresql_url,
@@ -27,7 +34,7 @@ class TestBooleanCoercion:
 
     @pytest.mark.parametrize(
         "value",
-        ["true", "True", "TRUE", "1", "yes", "Yes", "YES", "on", "On", "ON"],
+        ["true", "True", "TRUE", "1", "yes", "Yes", "YES", "on", "On", "ON", "tRuE", "yEs"],
     )
     def test_coerce_bool_true(self, value: str) -> None:
         """Test various representations of true."""
@@ -35,7 +42,7 @@ class TestBooleanCoercion:
 
     @pytest.mark.parametrize(
         "value",
-        ["false", "False", "FALSE", "0", "no", "No", "NO", "off", "Off", "OFF"],
+        ["false", "False", "FALSE", "0", "no", "No", "NO", "off", "Off", "OFF", "fAlSe", "oFf"],
     )
     def test_coerce_bool_false(self, value: str) -> None:
         """Test various representations of false."""
@@ -266,6 +273,10 @@ class TestIpv4Validation:
             "192.168.1",  # Too few octets
             "192.168.1.1.1",  # Too many octets
             "not.an.ip.address",  # Non-numeric
+            "192.168..1",  # Empty octet
+            "1.2.3.1000",  # Octet too long
+            "1.2.3.-1",  # Signed octet
+            "192.168.1.1\n",  # Trailing newline
         ],
     )
     def test_invalid_ipv4(self, ip: str) -> None:
@@ -312,6 +323,67 @@ class TestPatternValidation:
         """Test non-matching pattern."""
         assert validate_pattern("ABC123", r"^[a-z]+\d+$") is False
 
+    def test_validate_pattern_compiles_once(self) -> None:
+        """Test repeated validation reuses the cached compiled pattern."""
+        pattern = r"^cache_[0-9]+$"
+        assert validate_pattern("cache_1", pattern) is True
+        misses = _compile_pattern.cache_info().misses
+        assert validate_pattern("cache_2", pattern) is True
+        assert validate_pattern("nope", pattern) is False
+        assert _compile_pattern.cache_info().misses == misses
+
+    @pytest.mark.parametrize(
+        "pattern,prefix",
+        [
+            (r"^sk_(test|live)_[a-zA-Z0-9]{12,}$", "sk_"),
+            (r"^a\.b+", "a."),
+            (r"^abc*d", "ab"),  # Quantified "c" stays in the regex
+            (r"^a|b", ""),  # Top-level alternation can't be split
+            (r"^\d+", ""),
+            (r"[a-z]+", ""),
+        ],
+    )
+    def test_analyze_pattern_literal_prefix(self, pattern: str, prefix: str) -> None:
+        """Test anchored literal prefixes are peeled off only when safe."""
+        assert _analyze_pattern(pattern)[0] == prefix
+
+    @pytest.mark.parametrize(
+        "pattern",
+        [r"^sk_(test|live)_[a-zA-Z0-9]{12,}$", r"^abc*d", r"^a|b", r"^foo$", r"^x(?<=x)y"],
+    )
+    @pytest.mark.parametrize(
+        "value",
+        ["sk_test_abcdefghijkl", "sk_live_short", "abd", "abcccd", "b", "foo", "foo\n", "xy", "sk_", ""],
+    )
+    def test_prefix_fast_path_matches_re(self, pattern: str, value: str) -> None:
+        """Test the prefix fast path agrees with a plain re.match."""
+        assert validate_pattern(value, pattern) is (re.match(pattern, value) is not None)
+
+
+class TestFormatValidation:
+    """Tests for validation by format name."""
+
+    def test_custom_validator_not_cached(self) -> None:
+        """Test custom validators are called every time."""
+        calls = []
+
+        def record(value: str) -> bool:
+            calls.append(value)
+            return True
+
+        register_validator("recording", record)
+        try:
+            validate_format("x", "recording")
+            validate_format("x", "recording")
+        finally:
+            clear_custom_validators()
+        assert calls == ["x", "x"]
+
+    def test_unknown_format(self) -> None:
+        """Test unknown format names raise ValueError."""
+        with pytest.raises(ValueError, match="Unknown format validator"):
+            validate_format("x", "no_such_format")
+
 
 class TestRangeValidation:
     """Tests for range validation."""